@@ -0,0 +1,108 @@
+"""
+Buffered audit writer.
+
+Entries recorded inside an atomic block are flushed with one bulk insert per
+savepoint level when the transaction commits (and dropped along with a
+rolled-back transaction or savepoint). Entries recorded in
+autocommit mode go to the current `buffered()` scope - one per request via
+AuditMiddleware - and are flushed when the scope exits or AUDIT_BATCH_SIZE is
+reached. Outside any scope they are written right away.
+"""
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, transaction
+from django.utils import timezone
+
+from .models import AuditLog
+
+_buffer = ContextVar('audit_buffer', default=None)
+_request = ContextVar('audit_request', default=None)
+
+
+def _batch_size():
+    return getattr(settings, 'AUDIT_BATCH_SIZE', 500)
+
+
+def flush(entries):
+    if entries:
+        AuditLog.objects.bulk_create(entries, batch_size=_batch_size())
+
+
+def current_user():
+    request = _request.get()
+    # DRF authenticates inside the view and copies the user back onto the
+    # Django request, so this has to be read lazily.
+    user = getattr(request, 'user', None)
+    if user is not None and user.is_authenticated:
+        return user
+    return None
+
+
+def _pending_for(connection):
+    # One list per savepoint level, each flushed by its own on_commit callback.
+    # Django drops the callbacks registered inside a savepoint that rolls back,
+    # so entries recorded there are dropped with them.
+    key = tuple(connection.savepoint_ids)
+    live = {item[1] for item in connection.run_on_commit}
+    pending = {
+        sids: (callback, entries)
+        for sids, (callback, entries) in (getattr(connection, '_audit_pending', None) or {}).items()
+        if callback in live
+    }
+    if key in pending:
+        connection._audit_pending = pending
+        return pending[key][1]
+
+    entries = []
+
+    def callback():
+        connection._audit_pending = None
+        flush(entries)
+
+    pending[key] = (callback, entries)
+    connection._audit_pending = pending
+    transaction.on_commit(callback, using=connection.alias)
+    return entries
+
+
+def record(action, instance, changes, using=DEFAULT_DB_ALIAS):
+    user = current_user()
+    entry = AuditLog(
+        created_at=timezone.now(),
+        action=action,
+        object_type=instance._meta.label_lower,
+        object_id=str(instance.pk),
+        user_id=user.pk if user else None,
+        username=user.get_username() if user else "",
+        changes=changes,
+    )
+
+    connection = transaction.get_connection(using)
+    if connection.in_atomic_block:
+        _pending_for(connection).append(entry)
+        return
+
+    buffer = _buffer.get()
+    if buffer is None:
+        flush([entry])
+        return
+    buffer.append(entry)
+    if len(buffer) >= _batch_size():
+        flush(buffer)
+        buffer.clear()
+
+
+@contextmanager
+def buffered(request=None):
+    buffer_token = _buffer.set([])
+    request_token = _request.set(request) if request is not None else None
+    try:
+        yield
+    finally:
+        entries = _buffer.get()
+        _buffer.reset(buffer_token)
+        if request_token is not None:
+            _request.reset(request_token)
+        flush(entries)
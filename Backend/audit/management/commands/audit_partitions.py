@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.utils import timezone
+
+from audit.partitions import ensure_partitions
+
+
+class Command(BaseCommand):
+    help = "Creates the upcoming monthly partitions of audit.audit_log (PostgreSQL). Run it monthly."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--months-ahead', type=int, default=3)
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'postgresql':
+            self.stdout.write("Not a PostgreSQL database, audit_log is not partitioned.")
+            return
+        with connection.cursor() as cursor:
+            created = ensure_partitions(cursor, timezone.now().date(), options['months_ahead'])
+        self.stdout.write(self.style.SUCCESS(f"Partitions ready: {', '.join(created)}"))
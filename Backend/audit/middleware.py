@@ -0,0 +1,15 @@
+from .log import buffered
+
+
+class AuditMiddleware:
+    """
+    Collects the audit entries of a request and writes them in one batch
+    once the response is ready.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with buffered(request):
+            return self.get_response(request)
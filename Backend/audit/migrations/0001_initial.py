@@ -0,0 +1,33 @@
+# Generated by Django 5.2.9 on 2026-10-19 12:07
+
+import django.core.serializers.json
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AuditLog',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('action', models.CharField(choices=[('create', 'Create'), ('update', 'Update'), ('delete', 'Delete')], max_length=10)),
+                ('object_type', models.CharField(max_length=100)),
+                ('object_id', models.CharField(max_length=64)),
+                ('user_id', models.BigIntegerField(blank=True, null=True)),
+                ('username', models.CharField(blank=True, default='', max_length=150)),
+                ('changes', models.JSONField(default=dict, encoder=django.core.serializers.json.DjangoJSONEncoder)),
+            ],
+            options={
+                'db_table': 'audit_log',
+                'indexes': [models.Index(fields=['object_type', 'object_id', '-created_at'], name='audit_log_object_idx'), models.Index(fields=['user_id', '-created_at'], name='audit_log_user_idx')],
+            },
+        ),
+    ]
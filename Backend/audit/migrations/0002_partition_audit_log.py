@@ -0,0 +1,86 @@
+"""
+On PostgreSQL, moves audit_log into the `audit` schema created by init_db.sql
+as a table partitioned by month on created_at, and makes it append-only with
+a trigger. Other backends keep the plain table from 0001.
+
+The ORM keeps using the unqualified name `audit_log`; it resolves through the
+search_path set on every connection (DATABASES OPTIONS in settings).
+"""
+from django.db import migrations
+from django.utils import timezone
+
+from audit.partitions import ensure_partitions
+
+
+CREATE_SQL = """
+CREATE SCHEMA IF NOT EXISTS audit;
+DROP TABLE audit_log;
+CREATE SEQUENCE audit.audit_log_id_seq;
+CREATE TABLE audit.audit_log (
+    id bigint NOT NULL DEFAULT nextval('audit.audit_log_id_seq'),
+    created_at timestamp with time zone NOT NULL,
+    action varchar(10) NOT NULL,
+    object_type varchar(100) NOT NULL,
+    object_id varchar(64) NOT NULL,
+    user_id bigint NULL,
+    username varchar(150) NOT NULL,
+    changes jsonb NOT NULL,
+    PRIMARY KEY (id, created_at)
+) PARTITION BY RANGE (created_at);
+ALTER SEQUENCE audit.audit_log_id_seq OWNED BY audit.audit_log.id;
+CREATE TABLE audit.audit_log_default PARTITION OF audit.audit_log DEFAULT;
+CREATE INDEX audit_log_object_idx ON audit.audit_log (object_type, object_id, created_at DESC);
+CREATE INDEX audit_log_user_idx ON audit.audit_log (user_id, created_at DESC);
+
+CREATE FUNCTION audit.reject_change() RETURNS trigger AS $$
+BEGIN
+    RAISE EXCEPTION 'audit.audit_log is append-only';
+END;
+$$ LANGUAGE plpgsql;
+CREATE TRIGGER audit_log_append_only
+    BEFORE UPDATE OR DELETE ON audit.audit_log
+    FOR EACH ROW EXECUTE FUNCTION audit.reject_change();
+"""
+
+REVERSE_SQL = """
+DROP TABLE audit.audit_log;
+DROP FUNCTION audit.reject_change();
+CREATE TABLE audit_log (
+    id bigint GENERATED BY DEFAULT AS IDENTITY PRIMARY KEY,
+    created_at timestamp with time zone NOT NULL,
+    action varchar(10) NOT NULL,
+    object_type varchar(100) NOT NULL,
+    object_id varchar(64) NOT NULL,
+    user_id bigint NULL,
+    username varchar(150) NOT NULL,
+    changes jsonb NOT NULL
+);
+CREATE INDEX audit_log_object_idx ON audit_log (object_type, object_id, created_at DESC);
+CREATE INDEX audit_log_user_idx ON audit_log (user_id, created_at DESC);
+"""
+
+
+def partition(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(CREATE_SQL)
+        ensure_partitions(cursor, timezone.now().date())
+
+
+def unpartition(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(REVERSE_SQL)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('audit', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(partition, unpartition),
+    ]
@@ -0,0 +1,57 @@
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+from django.utils import timezone
+
+
+class AppendOnlyError(Exception):
+    pass
+
+
+class AuditLogQuerySet(models.QuerySet):
+    def update(self, **kwargs):
+        raise AppendOnlyError("Audit entries cannot be updated")
+
+    def delete(self):
+        raise AppendOnlyError("Audit entries cannot be deleted")
+
+
+class AuditLog(models.Model):
+    """
+    Field level change history. Append-only: rows are written in batches by
+    audit.log and never updated or deleted. On PostgreSQL the table lives in
+    the `audit` schema and is partitioned by month (see migration 0002).
+    """
+    ACTION_CHOICES = [
+        ("create", "Create"),
+        ("update", "Update"),
+        ("delete", "Delete"),
+    ]
+
+    created_at = models.DateTimeField(default=timezone.now)
+    action = models.CharField(max_length=10, choices=ACTION_CHOICES)
+    object_type = models.CharField(max_length=100)  # model label, e.g. "rh.leaverequest"
+    object_id = models.CharField(max_length=64)
+    # No FK: the trail has to outlive the users it mentions
+    user_id = models.BigIntegerField(null=True, blank=True)
+    username = models.CharField(max_length=150, blank=True, default="")
+    changes = models.JSONField(encoder=DjangoJSONEncoder, default=dict)  # {field: [old, new]}
+
+    objects = AuditLogQuerySet.as_manager()
+
+    class Meta:
+        db_table = 'audit_log'
+        indexes = [
+            models.Index(fields=['object_type', 'object_id', '-created_at'], name='audit_log_object_idx'),
+            models.Index(fields=['user_id', '-created_at'], name='audit_log_user_idx'),
+        ]
+
+    def save(self, *args, **kwargs):
+        if not self._state.adding:
+            raise AppendOnlyError("Audit entries cannot be updated")
+        super().save(*args, **kwargs)
+
+    def delete(self, *args, **kwargs):
+        raise AppendOnlyError("Audit entries cannot be deleted")
+
+    def __str__(self):
+        return f"{self.action} {self.object_type}#{self.object_id}"
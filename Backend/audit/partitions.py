@@ -0,0 +1,35 @@
+"""
+Monthly range partitions of audit.audit_log (PostgreSQL only).
+"""
+from datetime import date
+
+SCHEMA = 'audit'
+TABLE = 'audit_log'
+
+
+def month_start(day, offset=0):
+    month = day.month - 1 + offset
+    return date(day.year + month // 12, month % 12 + 1, 1)
+
+
+def partition_name(month):
+    return f'{TABLE}_{month:%Y_%m}'
+
+
+def create_partition_sql(month):
+    start, end = month_start(month), month_start(month, 1)
+    return (
+        f'CREATE TABLE IF NOT EXISTS {SCHEMA}.{partition_name(start)} '
+        f'PARTITION OF {SCHEMA}.{TABLE} '
+        f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+    )
+
+
+def ensure_partitions(cursor, today, months_ahead=3):
+    """Creates the partitions from `today`'s month to `months_ahead` months later."""
+    created = []
+    for offset in range(months_ahead + 1):
+        month = month_start(today, offset)
+        cursor.execute(create_partition_sql(month))
+        created.append(partition_name(month))
+    return created
@@ -0,0 +1,7 @@
+from rest_framework import serializers
+from .models import AuditLog
+
+class AuditLogSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = AuditLog
+        fields = ['id', 'created_at', 'action', 'object_type', 'object_id', 'user_id', 'username', 'changes']
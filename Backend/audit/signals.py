@@ -0,0 +1,68 @@
+from django.apps import apps
+from django.conf import settings
+from django.db.models.signals import post_delete, post_init, post_save
+
+from . import log
+
+DEFAULT_AUDIT_MODELS = {
+    'rh.Employee': ['salaire', 'statut'],
+    'rh.LeaveRequest': ['statut'],
+    'rh.ExpenseReport': ['statut'],
+    'rh.Authorization': ['statut'],
+}
+
+
+# model class -> tuple of audited field names, filled by connect_tracked_models()
+_tracked = {}
+
+
+def tracked_fields(model):
+    return _tracked.get(model, ())
+
+
+def _snapshot(instance):
+    fields = _tracked[type(instance)]
+    # Deferred fields are skipped, they would cost a query each
+    deferred = instance.get_deferred_fields()
+    return {f: getattr(instance, f) for f in fields if f not in deferred}
+
+
+def _on_init(sender, instance, **kwargs):
+    instance._audit_snapshot = _snapshot(instance)
+
+
+def _on_save(sender, instance, created, raw=False, using=None, update_fields=None, **kwargs):
+    if raw:
+        return
+    current = _snapshot(instance)
+    if created:
+        changes = {f: [None, value] for f, value in current.items()}
+        log.record('create', instance, changes, using=using)
+    else:
+        previous = getattr(instance, '_audit_snapshot', {})
+        changes = {
+            f: [previous[f], value]
+            for f, value in current.items()
+            if f in previous and previous[f] != value
+        }
+        if changes:
+            log.record('update', instance, changes, using=using)
+    instance._audit_snapshot = current
+
+
+def _on_delete(sender, instance, using=None, **kwargs):
+    changes = {f: [value, None] for f, value in getattr(instance, '_audit_snapshot', {}).items()}
+    log.record('delete', instance, changes, using=using)
+
+
+def connect_tracked_models():
+    """Hooks the models listed in settings.AUDIT_MODELS ({label: [fields]})."""
+    for label, fields in getattr(settings, 'AUDIT_MODELS', DEFAULT_AUDIT_MODELS).items():
+        model = apps.get_model(label)
+        if fields == '__all__':
+            fields = [f.attname for f in model._meta.concrete_fields if not f.primary_key]
+        _tracked[model] = tuple(fields)
+        uid = f'audit:{label}'
+        post_init.connect(_on_init, sender=model, dispatch_uid=uid)
+        post_save.connect(_on_save, sender=model, dispatch_uid=uid)
+        post_delete.connect(_on_delete, sender=model, dispatch_uid=uid)
@@ -0,0 +1,57 @@
+from datetime import date
+from decimal import Decimal
+
+from django.db import transaction
+from django.test import TestCase
+
+from rh.models import Employee
+
+from .models import AuditLog
+
+
+class SavepointTests(TestCase):
+    def setUp(self):
+        Employee.objects.create(
+            code='E1', nom='Nom', prenom='Prenom', email='e1@example.com', poste='Dev',
+            departement='IT', dateEmbauche=date(2020, 1, 1), salaire=Decimal('1000'),
+        )
+
+    def _update(self, **fields):
+        employee = Employee.objects.get(code='E1')
+        for name, value in fields.items():
+            setattr(employee, name, value)
+        employee.save()
+
+    def _logged(self):
+        return list(AuditLog.objects.filter(action='update').order_by('id').values_list('changes', flat=True))
+
+    def test_rolled_back_savepoint_entries_are_dropped(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            with transaction.atomic():
+                self._update(statut='Inactif')
+                try:
+                    with transaction.atomic():
+                        self._update(salaire=Decimal('9999'))
+                        raise RuntimeError
+                except RuntimeError:
+                    pass
+                with transaction.atomic():
+                    self._update(statut='En congé')
+        self.assertEqual(self._logged(), [
+            {'statut': ['Actif', 'Inactif']},
+            {'statut': ['Inactif', 'En congé']},
+        ])
+
+    def test_rolled_back_transaction_does_not_leak_into_the_next(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            try:
+                with transaction.atomic():
+                    self._update(statut='Inactif')
+                    raise RuntimeError
+            except RuntimeError:
+                pass
+        self.assertEqual(self._logged(), [])
+        with self.captureOnCommitCallbacks(execute=True):
+            with transaction.atomic():
+                self._update(statut='En congé')
+        self.assertEqual(self._logged(), [{'statut': ['Actif', 'En congé']}])
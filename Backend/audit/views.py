@@ -0,0 +1,45 @@
+from rest_framework import viewsets
+from rest_framework.exceptions import ValidationError
+from rest_framework.pagination import CursorPagination
+from .models import AuditLog
+from .serializers import AuditLogSerializer
+from users.permissions import IsAdmin
+
+
+class AuditLogPagination(CursorPagination):
+    ordering = '-created_at'
+    page_size = 100
+
+
+class AuditLogViewSet(viewsets.ReadOnlyModelViewSet):
+    """
+    Read-only access to the audit trail, filtered by object or by user:
+        /api/audit/?object_type=rh.leaverequest&object_id=12
+        /api/audit/?user_id=3
+    Both filters are backed by an index on (..., created_at).
+    """
+    serializer_class = AuditLogSerializer
+    permission_classes = [IsAdmin]
+    pagination_class = AuditLogPagination
+
+    def get_queryset(self):
+        params = self.request.query_params
+        queryset = AuditLog.objects.all()
+        if self.action != 'list':
+            return queryset
+
+        object_type = params.get('object_type')
+        object_id = params.get('object_id')
+        user_id = params.get('user_id')
+        if object_type:
+            queryset = queryset.filter(object_type=object_type.lower())
+            if object_id:
+                queryset = queryset.filter(object_id=object_id)
+        elif object_id:
+            raise ValidationError({'object_type': "Required when filtering on object_id."})
+        if user_id:
+            try:
+                queryset = queryset.filter(user_id=int(user_id))
+            except ValueError:
+                raise ValidationError({'user_id': "Must be an integer."})
+        return queryset
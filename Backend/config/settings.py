@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
+import os
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -33,8 +34,11 @@ CORS_ALLOW_ALL_ORIGINS = True # For development
 
 # Application definition
 
+# Optional components, off to shorten worker boot (see `manage.py profile_startup`)
+ENABLE_ADMIN = os.environ.get('ENABLE_ADMIN', '1') == '1'
+ENABLE_API_DOCS = os.environ.get('ENABLE_API_DOCS', '1') == '1'
+
 INSTALLED_APPS = [
-    'django.contrib.admin',
     'django.contrib.auth',
     'django.contrib.contenttypes',
     'django.contrib.sessions',
@@ -44,12 +48,17 @@ INSTALLED_APPS = [
     'rest_framework',
     'django_filters',
     'corsheaders',  # Added
-    'drf_yasg', # Added
     # Local
+    'core',
     'users',
     'rh',
     'projects',
+    'audit',
 ]
+if ENABLE_ADMIN:
+    INSTALLED_APPS.insert(0, 'django.contrib.admin')
+if ENABLE_API_DOCS:
+    INSTALLED_APPS.append('drf_yasg')
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
@@ -58,11 +67,83 @@ REST_FRAMEWORK = {
     'DEFAULT_PERMISSION_CLASSES': (
         'rest_framework.permissions.IsAuthenticated',
     ),
+    'DEFAULT_RENDERER_CLASSES': (
+        'core.renderers.FastJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ),
+    'DEFAULT_PARSER_CLASSES': (
+        'core.parsers.FastJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ),
+    # Counters live in the default cache, shared between workers when REDIS_URL is set
+    'DEFAULT_THROTTLE_CLASSES': (
+        'rest_framework.throttling.UserRateThrottle',
+        'rest_framework.throttling.ScopedRateThrottle',
+    ),
+    'DEFAULT_THROTTLE_RATES': {
+        'user': '5000/hour',
+        # per user, on the list action of the views with a matching throttle_scope
+        'time-records': '30/min',
+        'projects': '30/min',
+    },
+}
+
+# API_THROTTLING=0 turns throttling off, e.g. for capacity runs of `manage.py loadtest`
+if os.environ.get('API_THROTTLING', '1') != '1':
+    REST_FRAMEWORK['DEFAULT_THROTTLE_CLASSES'] = ()
+
+# Concurrent identical list GETs share one query (core.mixins.CoalescedListMixin)
+COALESCE_REQUESTS = True
+
+# API docs (core.schema): the spec is served from this file when set, written by
+# `manage.py generate_swagger` at image build (see Dockerfile), otherwise
+# generated on first use
+API_SCHEMA_FILE = os.environ.get('API_SCHEMA_FILE')
+SWAGGER_SETTINGS = {
+    'DEFAULT_INFO': 'core.openapi.info',
+    'SPEC_URL': 'schema-json',
+}
+REDOC_SETTINGS = {
+    'SPEC_URL': 'schema-json',
+}
+
+# Response compression (core.middleware.CompressionMiddleware).
+# br and zstd are only used when `brotli` / `zstandard` are installed.
+COMPRESSION_ENCODINGS = ['zstd', 'br', 'gzip']
+COMPRESSION_MIN_SIZE = 1024  # bytes
+# JSON only: HTML carries CSRF tokens (BREACH)
+COMPRESSION_CONTENT_TYPES = ['application/json']
+
+# Audit trail (audit app): audited fields per model, and max rows per insert
+AUDIT_MODELS = {
+    'rh.Employee': ['salaire', 'statut'],
+    'rh.LeaveRequest': ['statut'],
+    'rh.ExpenseReport': ['statut'],
+    'rh.Authorization': ['statut'],
+}
+AUDIT_BATCH_SIZE = 500
+
+# Cache lifetime of /api/projects/portfolio/, also invalidated on project / expense changes
+PORTFOLIO_CACHE_SECONDS = 300
+
+# Directory delta sync (rh.directory): change log retention, older tokens get a
+# full snapshot (`manage.py purge_directory_changes`), and how long a missing
+# change id is looked for again. Must exceed the longest transaction writing
+# employees / users (imports, data migrations), later commits are missed.
+DIRECTORY_CHANGE_DAYS = 30
+DIRECTORY_SYNC_GAP_SECONDS = 3600
+
+# Retention of the hot tables, see `manage.py archive_records`
+ARCHIVE_HORIZON_DAYS = {
+    'time-records': 365,
+    'notifications': 90,
 }
 
 
 MIDDLEWARE = [
     'corsheaders.middleware.CorsMiddleware', # Added
+    'core.middleware.CompressionMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -70,6 +151,7 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'audit.middleware.AuditMiddleware',
 ]
 
 ROOT_URLCONF = 'config.urls'
@@ -97,10 +179,35 @@ WSGI_APPLICATION = 'config.wsgi.application'
 
 DATABASES = {
     'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
+        'ENGINE': os.environ.get('DB_ENGINE', 'django.db.backends.sqlite3'),
+        'NAME': os.environ.get('DB_NAME', BASE_DIR / 'db.sqlite3'),
+        'USER': os.environ.get('DB_USER', ''),
+        'PASSWORD': os.environ.get('DB_PASSWORD', ''),
+        'HOST': os.environ.get('DB_HOST', ''),
+        'PORT': os.environ.get('DB_PORT', ''),
     }
 }
+if 'postgresql' in DATABASES['default']['ENGINE']:
+    # Per connection rather than init_db.sql's ALTER DATABASE, which the test
+    # database and any other DB_NAME never get: audit_log lives in `audit`
+    DATABASES['default']['OPTIONS'] = {'options': '-c search_path=api,public,audit'}
+
+
+# Cache (throttling, portfolio analytics): Redis when available, else per process
+REDIS_URL = os.environ.get('REDIS_URL')
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
 
 
 # Password validation
@@ -122,6 +229,27 @@ AUTH_PASSWORD_VALIDATORS = [
 ]
 
 
+# Password hashing: the first hasher hashes new passwords, the others still
+# verify existing hashes, which are upgraded on the next successful login.
+# PASSWORD_HASHER=argon2 (argon2-cffi) | scrypt (stdlib) | pbkdf2
+_PASSWORD_HASHERS = {
+    'argon2': 'users.hashers.TunedArgon2PasswordHasher',
+    'scrypt': 'users.hashers.TunedScryptPasswordHasher',
+    'pbkdf2': 'django.contrib.auth.hashers.PBKDF2PasswordHasher',
+}
+PASSWORD_HASHER = os.environ.get('PASSWORD_HASHER', 'argon2')
+PASSWORD_HASHERS = [_PASSWORD_HASHERS[PASSWORD_HASHER]] + [
+    hasher for name, hasher in _PASSWORD_HASHERS.items() if name != PASSWORD_HASHER
+]
+SCRYPT_WORK_FACTOR = 2 ** 14
+ARGON2_TIME_COST = 2
+ARGON2_MEMORY_COST = 19 * 1024  # KiB, OWASP minimum for argon2id
+ARGON2_PARALLELISM = 1
+
+AUTHENTICATION_BACKENDS = ['users.backends.PooledModelBackend']
+PASSWORD_HASH_WORKERS = int(os.environ.get('PASSWORD_HASH_WORKERS', 0)) or None  # None: CPU count
+
+
 # Internationalization
 # https://docs.djangoproject.com/en/5.2/topics/i18n/
 
@@ -1,32 +1,17 @@
-from django.contrib import admin
+from django.conf import settings
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from rest_framework import permissions
-from drf_yasg.views import get_schema_view
-from drf_yasg import openapi
-from rest_framework_simplejwt.views import (
-    TokenObtainPairView,
-    TokenRefreshView,
-)
+from rest_framework_simplejwt.views import TokenRefreshView
 
-from users.views import UserViewSet, NotificationViewSet
+from users.views import UserViewSet, NotificationViewSet, LoginView
 from rh.views import (
     EmployeeViewSet, LeaveRequestViewSet, TimeRecordViewSet,
-    ExpenseReportViewSet, AuthorizationViewSet
+    ExpenseReportViewSet, AuthorizationViewSet, BulkTransitionView, DirectorySyncView
 )
 from projects.views import ProjectViewSet, ProjectDocViewSet
+from audit.views import AuditLogViewSet
 
 
-schema_view = get_schema_view(
-    openapi.Info(
-        title="Entreprise API",
-        default_version='v1',
-        description="API documentation for Entreprise application",
-    ),
-    public=True,
-    permission_classes=(permissions.AllowAny,),
-)
-
 router = DefaultRouter()
 router.register(r'users', UserViewSet)
 router.register(r'notifications', NotificationViewSet, basename='notification')
@@ -38,16 +23,27 @@ router.register(r'expenses', ExpenseReportViewSet)
 router.register(r'authorizations', AuthorizationViewSet)
 router.register(r'projects', ProjectViewSet)
 router.register(r'project-docs', ProjectDocViewSet)
+router.register(r'audit', AuditLogViewSet, basename='audit')
 
 urlpatterns = [
-    path('admin/', admin.site.urls),
     path('api/', include(router.urls)),
+    path('api/bulk-transition/', BulkTransitionView.as_view(), name='bulk_transition'),
+    path('api/directory/', DirectorySyncView.as_view(), name='directory_sync'),
     
     # JWT Authentication
-    path('api/token/', TokenObtainPairView.as_view(), name='token_obtain_pair'),
-    path('api/token/refresh/', TokenRefreshView.as_view(), name='token_refresh'),
-
-    # Swagger Documentation
-    path('swagger/', schema_view.with_ui('swagger', cache_timeout=0), name='schema-swagger-ui'),
-    path('redoc/', schema_view.with_ui('redoc', cache_timeout=0), name='schema-redoc'),
+    path('api/token/', LoginView.as_view(), name='token_obtain_pair'),
+    path('api/token/refresh/', TokenRefreshView.as_view(throttle_classes=[]), name='token_refresh'),
 ]
+
+if settings.ENABLE_ADMIN:
+    from django.contrib import admin
+    urlpatterns.append(path('admin/', admin.site.urls))
+
+# Swagger Documentation, drf_yasg is only imported on the first docs request
+if settings.ENABLE_API_DOCS:
+    from core.schema import schema_json, schema_ui
+    urlpatterns += [
+        path('swagger.json', schema_json, name='schema-json'),
+        path('swagger/', schema_ui('swagger'), name='schema-swagger-ui'),
+        path('redoc/', schema_ui('redoc'), name='schema-redoc'),
+    ]
@@ -0,0 +1,51 @@
+from django.db import connection, transaction
+
+
+def _conflicts(archive_model, rows):
+    # Hot rows clashing with an archived row on any unique column (e.g. a
+    # TimeRecord code reused after the first one was archived, or an id that
+    # SQLite handed out again)
+    clashing = set()
+    for field in archive_model._meta.concrete_fields:
+        if not field.unique:
+            continue
+        values = [row[field.attname] for row in rows]
+        taken = set(archive_model.objects.filter(**{f'{field.attname}__in': values}).values_list(field.attname, flat=True))
+        clashing.update(row['id'] for row in rows if row[field.attname] in taken)
+    return clashing
+
+
+def archive_batch(model, archive_model, date_field, cutoff, batch_size, skip=()):
+    """
+    Moves up to `batch_size` rows older than `cutoff` from `model` to
+    `archive_model` in one short transaction. Rows that clash with an archived
+    row are left in place. Returns (rows moved, ids of the clashing rows).
+    """
+    fields = [f.attname for f in archive_model._meta.concrete_fields if f.name != 'archived_at']
+    with transaction.atomic():
+        queryset = model.objects.filter(**{f'{date_field}__lt': cutoff}).exclude(pk__in=skip).order_by(date_field, 'pk')
+        if connection.features.has_select_for_update_skip_locked:
+            # Rows being edited right now are left for the next run instead of blocking on them
+            queryset = queryset.select_for_update(skip_locked=True, of=('self',))
+        rows = list(queryset.values(*fields)[:batch_size])
+        conflicts = _conflicts(archive_model, rows) if rows else set()
+        rows = [row for row in rows if row['id'] not in conflicts]
+        if rows:
+            # No ignore_conflicts: anything clashing past the check above fails the batch
+            archive_model.objects.bulk_create([archive_model(**row) for row in rows])
+            model.objects.filter(pk__in=[row['id'] for row in rows]).delete()
+    return len(rows), sorted(conflicts)
+
+
+def archive_older_than(model, archive_model, date_field, cutoff, batch_size=1000, max_batches=None):
+    """Returns (rows moved, ids of the rows left in place because they clash with the archive)."""
+    total = batches = 0
+    conflicts = []
+    while max_batches is None or batches < max_batches:
+        moved, clashing = archive_batch(model, archive_model, date_field, cutoff, batch_size, skip=conflicts)
+        if not moved and not clashing:
+            break
+        total += moved
+        conflicts += clashing
+        batches += 1
+    return total, conflicts
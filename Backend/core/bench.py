@@ -0,0 +1,24 @@
+"""Helpers shared by the bench_* management commands."""
+from contextlib import contextmanager
+from datetime import date
+from decimal import Decimal
+
+from django.db import transaction
+
+from rh.models import Employee
+
+
+@contextmanager
+def rolled_back(using=None):
+    """Runs the block in a transaction that is always rolled back."""
+    with transaction.atomic(using=using):
+        yield
+        transaction.set_rollback(True, using=using)
+
+
+def bench_employee(**fields):
+    defaults = {
+        'code': 'bench-emp', 'nom': 'Bench', 'prenom': 'Mark', 'email': 'bench@example.com',
+        'poste': 'Dev', 'departement': 'IT', 'dateEmbauche': date(2020, 1, 1), 'salaire': Decimal('3500.00'),
+    }
+    return Employee.objects.create(**{**defaults, **fields})
@@ -0,0 +1,49 @@
+"""
+Single-flight: concurrent callers with the same key share one execution.
+
+The first caller (leader) runs the function; callers arriving while it runs
+wait for it and get the same result (or exception). Nothing is cached once
+the leader is done. Coalescing is per process, so with threaded gunicorn
+workers each worker runs an identical request at most once at a time.
+"""
+import threading
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, key, func):
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func()
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+
+requests = SingleFlight()
@@ -0,0 +1,90 @@
+import gzip
+import secrets
+
+from django.utils.crypto import get_random_string
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+
+# Upper bound of the random FNAME padding in gzip output, as GZipMiddleware
+GZIP_MAX_RANDOM_BYTES = 100
+
+
+def _gzip(data, level):
+    # Random-length padding in the header varies the output length of
+    # identical bodies, the BREACH mitigation of django.utils.text.compress_string
+    compressed = gzip.compress(data, compresslevel=level, mtime=0)
+    header = bytearray(compressed[:10])
+    header[3] = gzip.FNAME
+    filename = get_random_string(secrets.randbelow(GZIP_MAX_RANDOM_BYTES) + 1).encode() + b'\x00'
+    return bytes(header) + filename + compressed[10:]
+
+
+def _brotli(data, level):
+    return brotli.compress(data, quality=level)
+
+
+def _zstd(data, level):
+    return zstandard.ZstdCompressor(level=level).compress(data)
+
+
+# encoding -> (compress function, default level). Only codecs whose library
+# is importable are registered.
+CODECS = {'gzip': (_gzip, 6)}
+if brotli is not None:
+    CODECS['br'] = (_brotli, 5)
+if zstandard is not None:
+    CODECS['zstd'] = (_zstd, 3)
+
+
+def parse_accept_encoding(header):
+    """
+    Returns {encoding: qvalue} for an Accept-Encoding header, e.g.
+    "gzip, br;q=0.8" -> {'gzip': 1.0, 'br': 0.8}.
+    """
+    accepted = {}
+    for part in header.split(','):
+        coding, _, params = part.strip().partition(';')
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        for param in params.split(';'):
+            key, _, value = param.strip().partition('=')
+            if key.strip().lower() == 'q':
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        accepted[coding] = q
+    return accepted
+
+
+def negotiate_encoding(header, preferred):
+    """
+    Picks the encoding to use from `preferred` (server order) given the
+    client's Accept-Encoding header. Returns None when nothing matches.
+    """
+    accepted = parse_accept_encoding(header)
+    wildcard = accepted.get('*', 0.0)
+    best, best_q = None, 0.0
+    for encoding in preferred:
+        if encoding not in CODECS:
+            continue
+        q = accepted.get(encoding, wildcard)
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+def compress(data, encoding, level=None):
+    func, default_level = CODECS[encoding]
+    return func(data, default_level if level is None else level)
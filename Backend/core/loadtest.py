@@ -0,0 +1,271 @@
+"""
+HTTP load generator for `manage.py loadtest`.
+
+Virtual users (one thread and one keep-alive connection each) log in through
+/api/token/ and loop over their role scenario: admins list employees,
+managers approve pending leaves, employees clock time records. The number of
+active users follows a list of (duration, target) stages, interpolated
+linearly like k6 stages. Only the standard library is used on the client side.
+"""
+import http.client
+import json
+import math
+import random
+import threading
+import time
+import uuid
+from collections import Counter, defaultdict
+from datetime import date
+from urllib.parse import urlsplit
+
+ROLES = ('admin', 'manager', 'employee')
+
+
+def parse_stages(spec):
+    """'30s:10,1m:10,15s:0' -> [(30.0, 10), (60.0, 10), (15.0, 0)]"""
+    stages = []
+    for part in spec.split(','):
+        duration, _, target = part.strip().partition(':')
+        scale = {'s': 1, 'm': 60}.get(duration[-1:], None)
+        seconds = float(duration[:-1]) * scale if scale else float(duration)
+        stages.append((seconds, int(target)))
+    return stages
+
+
+def profile_stages(profile, users, duration, ramp):
+    if profile == 'constant':
+        return [(0, users), (duration, users)]
+    if profile == 'ramp':
+        return [(ramp, users), (duration, users), (ramp, 0)]
+    if profile == 'step':
+        steps = 4
+        stages = []
+        for i in range(1, steps + 1):
+            target = math.ceil(users * i / steps)
+            stages += [(0, target), (duration / steps, target)]
+        return stages
+    raise ValueError(profile)
+
+
+def target_users(stages, elapsed):
+    """Active users at `elapsed` seconds, None once all stages are done."""
+    current, start = 0, 0.0
+    for duration, target in stages:
+        if elapsed < start + duration:
+            return math.ceil(current + (target - current) * (elapsed - start) / duration)
+        current, start = target, start + duration
+    return None
+
+
+def assign_roles(count, mix):
+    """Smooth weighted round robin, so that every ramp step keeps the mix."""
+    weights = {role: weight for role, weight in mix.items() if weight > 0}
+    credit = dict.fromkeys(weights, 0)
+    total = sum(weights.values())
+    roles = []
+    for _ in range(count):
+        for role, weight in weights.items():
+            credit[role] += weight
+        role = max(credit, key=credit.get)
+        credit[role] -= total
+        roles.append(role)
+    return roles
+
+
+def percentile(values, p):
+    # Nearest rank on sorted values
+    if not values:
+        return None
+    return values[min(len(values) - 1, max(math.ceil(p / 100 * len(values)) - 1, 0))]
+
+
+class Metrics:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.latencies = defaultdict(list)
+        self.statuses = defaultdict(Counter)
+        self.errors = Counter()
+        self.timeline = defaultdict(Counter)
+        self.started = time.perf_counter()
+
+    def record(self, endpoint, status, latency, error):
+        second = int(time.perf_counter() - self.started)
+        with self._lock:
+            self.latencies[endpoint].append(latency * 1000)
+            self.statuses[endpoint][str(status)] += 1
+            self.timeline[second]['requests'] += 1
+            if error:
+                self.errors[endpoint] += 1
+                self.timeline[second]['errors'] += 1
+
+    def _summary(self, latencies, errors, elapsed):
+        latencies = sorted(latencies)
+        count = len(latencies)
+        return {
+            'requests': count,
+            'errors': errors,
+            'error_rate': errors / count if count else 0.0,
+            'throughput_rps': count / elapsed if elapsed else 0.0,
+            'latency_ms': {
+                'min': latencies[0] if count else None,
+                'mean': sum(latencies) / count if count else None,
+                'p50': percentile(latencies, 50),
+                'p90': percentile(latencies, 90),
+                'p95': percentile(latencies, 95),
+                'p99': percentile(latencies, 99),
+                'max': latencies[-1] if count else None,
+            },
+        }
+
+    def report(self, elapsed, active_users):
+        endpoints = {}
+        for endpoint in sorted(self.latencies):
+            endpoints[endpoint] = self._summary(self.latencies[endpoint], self.errors[endpoint], elapsed)
+            endpoints[endpoint]['statuses'] = dict(self.statuses[endpoint])
+        everything = [value for values in self.latencies.values() for value in values]
+        return {
+            'duration_seconds': elapsed,
+            'totals': self._summary(everything, sum(self.errors.values()), elapsed),
+            'endpoints': endpoints,
+            'timeline': [
+                {
+                    'second': second,
+                    'users': active_users.get(second, 0),
+                    'requests': self.timeline[second]['requests'],
+                    'errors': self.timeline[second]['errors'],
+                }
+                for second in sorted(self.timeline)
+            ],
+        }
+
+
+class VirtualUser:
+    def __init__(self, runner, index, role, username):
+        self.runner = runner
+        self.index = index
+        self.role = role
+        self.username = username
+        self.token = None
+        self.conn = None
+        self.iteration = 0
+
+    # HTTP
+
+    def _connect(self):
+        url = self.runner.url
+        cls = http.client.HTTPSConnection if url.scheme == 'https' else http.client.HTTPConnection
+        self.conn = cls(url.hostname, url.port, timeout=self.runner.timeout)
+
+    def request(self, method, path, endpoint, body=None, auth=True):
+        headers = {'Accept': 'application/json', 'Host': self.runner.url.netloc}
+        if body is not None:
+            body = json.dumps(body)
+            headers['Content-Type'] = 'application/json'
+        if auth:
+            headers['Authorization'] = f'Bearer {self.token}'
+        if self.conn is None:
+            self._connect()
+        start = time.perf_counter()
+        try:
+            self.conn.request(method, self.runner.url.path.rstrip('/') + path, body, headers)
+            response = self.conn.getresponse()
+            payload = response.read()
+            status = response.status
+        except (OSError, http.client.HTTPException):
+            self.conn.close()
+            self.conn = None
+            self.runner.metrics.record(endpoint, 'connection-error', time.perf_counter() - start, True)
+            return None, None
+        self.runner.metrics.record(endpoint, status, time.perf_counter() - start, status >= 400)
+        if status == 401 and auth:
+            self.token = None  # expired, log in again on the next iteration
+        try:
+            return status, json.loads(payload) if payload else None
+        except ValueError:
+            return status, None
+
+    def login(self):
+        status, data = self.request(
+            'POST', '/api/token/', 'POST /api/token/',
+            {'username': self.username, 'password': self.runner.password}, auth=False,
+        )
+        if status == 200:
+            self.token = data['access']
+        return self.token is not None
+
+    # Scenarios
+
+    def admin(self):
+        self.request('GET', '/api/employees/', 'GET /api/employees/')
+
+    def manager(self):
+        status, leaves = self.request('GET', '/api/leaves/', 'GET /api/leaves/')
+        if status != 200:
+            return
+        pending = [leave['id'] for leave in leaves if leave['statut'] == 'En attente']
+        if pending:
+            statut = 'Approuvé' if random.random() < 0.8 else 'Refusé'
+            self.request('PATCH', f'/api/leaves/{random.choice(pending)}/', 'PATCH /api/leaves/{id}/', {'statut': statut})
+
+    def employee(self):
+        self.iteration += 1
+        self.request('POST', '/api/time-records/', 'POST /api/time-records/', {
+            'code': f'LT-{uuid.uuid4().hex[:16]}',
+            'date': date.today().isoformat(),
+            'heureEntree': '08:30',
+            'heureSortie': '17:00',
+            'heures': '8.50',
+        })
+        if self.iteration % 5 == 0:
+            self.request('GET', '/api/time-records/', 'GET /api/time-records/')
+
+    def run(self):
+        runner = self.runner
+        try:
+            while not runner.stopped.is_set():
+                if self.index >= runner.active:
+                    runner.stopped.wait(0.05)
+                    continue
+                if self.token is None and not self.login():
+                    runner.stopped.wait(1.0)
+                    continue
+                getattr(self, self.role)()
+                if runner.think:
+                    runner.stopped.wait(random.uniform(0.5, 1.5) * runner.think)
+        finally:
+            if self.conn is not None:
+                self.conn.close()
+
+
+class Runner:
+    def __init__(self, base_url, stages, users, password, think=0.5, timeout=30.0):
+        self.url = urlsplit(base_url)
+        self.stages = stages
+        self.password = password
+        self.think = think
+        self.timeout = timeout
+        self.metrics = Metrics()
+        self.stopped = threading.Event()
+        self.active = 0
+        # users: [(role, username)], one per virtual user, in start order
+        self.users = [VirtualUser(self, index, role, username) for index, (role, username) in enumerate(users)]
+
+    def run(self):
+        threads = [threading.Thread(target=user.run, daemon=True) for user in self.users]
+        for thread in threads:
+            thread.start()
+        active_users = {}
+        start = time.perf_counter()
+        self.metrics.started = start
+        while True:
+            elapsed = time.perf_counter() - start
+            target = target_users(self.stages, elapsed)
+            if target is None:
+                break
+            self.active = min(target, len(self.users))
+            active_users[int(elapsed)] = max(active_users.get(int(elapsed), 0), self.active)
+            time.sleep(0.05)
+        self.stopped.set()
+        for thread in threads:
+            thread.join(self.timeout)
+        return self.metrics.report(time.perf_counter() - start, active_users)
@@ -0,0 +1,50 @@
+from datetime import timedelta
+
+from django.apps import apps
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from core.archive import archive_older_than
+
+# name -> (model, archive model, date field)
+TARGETS = {
+    'time-records': ('rh.TimeRecord', 'rh.TimeRecordArchive', 'date'),
+    'notifications': ('users.Notification', 'users.NotificationArchive', 'created_at'),
+}
+
+
+class Command(BaseCommand):
+    help = "Moves TimeRecord / Notification rows older than the retention horizon to their archive tables."
+
+    def add_arguments(self, parser):
+        parser.add_argument('targets', nargs='*', help=f"Any of {', '.join(TARGETS)} (default: all)")
+        parser.add_argument('--days', type=int, help="Override ARCHIVE_HORIZON_DAYS")
+        parser.add_argument('--batch-size', type=int, default=1000)
+        parser.add_argument('--max-batches', type=int, help="Stop after this many batches")
+
+    def handle(self, *args, **options):
+        horizons = getattr(settings, 'ARCHIVE_HORIZON_DAYS', {})
+        for name in options['targets'] or TARGETS:
+            if name not in TARGETS:
+                raise CommandError(f"Unknown target {name}, expected one of {', '.join(TARGETS)}")
+            label, archive_label, date_field = TARGETS[name]
+            days = options['days'] or horizons.get(name)
+            if not days:
+                raise CommandError(f"No retention horizon for {name}, set ARCHIVE_HORIZON_DAYS or --days")
+
+            model = apps.get_model(label)
+            cutoff = timezone.now() - timedelta(days=days)
+            if model._meta.get_field(date_field).get_internal_type() == 'DateField':
+                cutoff = cutoff.date()
+
+            moved, conflicts = archive_older_than(
+                model, apps.get_model(archive_label), date_field, cutoff,
+                batch_size=options['batch_size'], max_batches=options['max_batches'],
+            )
+            self.stdout.write(self.style.SUCCESS(f"{name}: archived {moved} rows older than {cutoff}"))
+            if conflicts:
+                self.stderr.write(self.style.WARNING(
+                    f"{name}: {len(conflicts)} rows left in place, they clash with archived rows "
+                    f"(ids {', '.join(map(str, conflicts[:20]))}{', ...' if len(conflicts) > 20 else ''})"
+                ))
@@ -0,0 +1,85 @@
+import threading
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import override_settings
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from projects.views import ProjectViewSet
+from rh.views import TimeRecordViewSet
+
+ENDPOINTS = {
+    'time-records': (TimeRecordViewSet, '/api/time-records/'),
+    'projects': (ProjectViewSet, '/api/projects/'),
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Fires bursts of identical concurrent GETs at the list endpoints and counts "
+        "DB queries with and without request coalescing. Read-only, uses the existing data."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--username', help="User to authenticate as (default: first admin)")
+        parser.add_argument('--concurrency', type=int, default=20)
+        parser.add_argument('--rounds', type=int, default=5)
+
+    def handle(self, *args, **options):
+        User = get_user_model()
+        if options['username']:
+            user = User.objects.filter(username=options['username']).first()
+        else:
+            user = User.objects.filter(role='admin').first()
+        if user is None:
+            raise CommandError("No matching user, pass --username")
+
+        self.stdout.write(f"{options['concurrency']} concurrent requests x {options['rounds']} rounds as {user.username}")
+        self.stdout.write(f"{'endpoint':<16}{'coalescing':<12}{'queries':>10}{'req/s':>10}")
+        for name, (viewset, path) in ENDPOINTS.items():
+            # Throttling would reject most of the burst and hide the DB work
+            view = viewset.as_view({'get': 'list'}, throttle_classes=[])
+            for enabled in (False, True):
+                with override_settings(COALESCE_REQUESTS=enabled):
+                    queries, elapsed, total = self._burst(view, path, user, options['concurrency'], options['rounds'])
+                self.stdout.write(
+                    f"{name:<16}{'on' if enabled else 'off':<12}{queries:>10}{total / elapsed:>10.1f}"
+                )
+
+    def _burst(self, view, path, user, concurrency, rounds):
+        factory = APIRequestFactory()
+        counter = {'queries': 0, 'errors': 0}
+        lock = threading.Lock()
+        barrier = threading.Barrier(concurrency)
+
+        def count(execute, sql, params, many, context):
+            with lock:
+                counter['queries'] += 1
+            return execute(sql, params, many, context)
+
+        def worker():
+            try:
+                with connection.execute_wrapper(count):
+                    for _ in range(rounds):
+                        barrier.wait()
+                        request = factory.get(path)
+                        force_authenticate(request, user=user)
+                        response = view(request)
+                        if response.status_code != 200:
+                            with lock:
+                                counter['errors'] += 1
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=worker) for _ in range(concurrency)]
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+        if counter['errors']:
+            raise CommandError(f"{counter['errors']} requests failed")
+        return counter['queries'], elapsed, concurrency * rounds
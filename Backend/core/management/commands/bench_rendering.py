@@ -0,0 +1,67 @@
+import time
+from datetime import date, time as dtime, timedelta
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand
+from rest_framework.renderers import JSONRenderer
+
+from core.bench import bench_employee, rolled_back
+from core.compression import CODECS, compress
+from core.renderers import FastJSONRenderer
+from projects.models import Project
+from projects.serializers import ProjectSerializer
+from rh.models import TimeRecord
+from rh.serializers import TimeRecordSerializer
+
+
+class Command(BaseCommand):
+    help = "Benchmarks JSON render time and compressed size of the largest list endpoints."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=20000, help="Synthetic rows per endpoint")
+        parser.add_argument('--repeat', type=int, default=5)
+
+    def handle(self, *args, **options):
+        rows, repeat = options['rows'], options['repeat']
+        with rolled_back():
+            self._seed(rows)
+            payloads = {
+                'time-records': TimeRecordSerializer(
+                    TimeRecord.objects.select_related('employe'), many=True).data,
+                'projects': ProjectSerializer(
+                    Project.objects.prefetch_related('docsList'), many=True).data,
+            }
+
+        renderers = [('drf', JSONRenderer()), ('orjson', FastJSONRenderer())]
+        self.stdout.write(f"{'endpoint':<14}{'renderer':<10}{'render ms':>10}{'bytes':>12}  compressed")
+        for endpoint, data in payloads.items():
+            for name, renderer in renderers:
+                start = time.perf_counter()
+                for _ in range(repeat):
+                    body = renderer.render(data)
+                elapsed = (time.perf_counter() - start) * 1000 / repeat
+                sizes = []
+                for encoding in CODECS:
+                    start = time.perf_counter()
+                    size = len(compress(body, encoding))
+                    ms = (time.perf_counter() - start) * 1000
+                    sizes.append(f"{encoding}={size} ({ms:.1f} ms)")
+                self.stdout.write(f"{endpoint:<14}{name:<10}{elapsed:>10.1f}{len(body):>12}  {' '.join(sizes)}")
+
+    def _seed(self, rows):
+        employee = bench_employee()
+        start = date(2020, 1, 1)
+        TimeRecord.objects.bulk_create([
+            TimeRecord(
+                employe=employee, code=f'bench-tr-{i}', date=start + timedelta(days=i),
+                heureEntree=dtime(8, 30), heureSortie=dtime(17, 0), heures=Decimal('8.50'),
+            )
+            for i in range(rows)
+        ], batch_size=1000)
+        Project.objects.bulk_create([
+            Project(
+                code=f'bench-prj-{i}', intitule=f'Projet {i}', client='Client', chefProjet='Mark Bench',
+                dateDebut=start, dateFin=start + timedelta(days=365), progression=i % 101,
+            )
+            for i in range(rows)
+        ], batch_size=1000)
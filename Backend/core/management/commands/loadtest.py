@@ -0,0 +1,147 @@
+import json
+import random
+from datetime import date, timedelta
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from core import loadtest
+from rh.models import Employee, LeaveRequest
+
+PREFIX = 'loadtest'
+
+
+class Command(BaseCommand):
+    help = (
+        "Load-tests a running server (e.g. `manage.py runserver` or gunicorn on SQLite / a local "
+        "Postgres) with a mix of admins listing employees, managers approving leaves and employees "
+        "clocking time records, and writes per-endpoint throughput, error rate and latency "
+        "percentiles as JSON. Test users and pending leaves are seeded in this command's database, "
+        "which must be the server's. Per-user throttles apply, start the server with "
+        "API_THROTTLING=0 to measure capacity."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--base-url', default='http://127.0.0.1:8000')
+        parser.add_argument('--profile', choices=['constant', 'ramp', 'step'], default='ramp')
+        parser.add_argument('--users', type=int, default=20, help="Peak virtual users")
+        parser.add_argument('--duration', type=float, default=60, help="Seconds at peak (whole run for step)")
+        parser.add_argument('--ramp', type=float, default=10, help="Ramp up / down seconds (ramp profile)")
+        parser.add_argument('--stages', help="Explicit stages, overrides --profile: '30s:10,1m:10,15s:0'")
+        parser.add_argument('--mix', default='admin=1,manager=2,employee=7', help="Relative weight per role")
+        parser.add_argument('--think', type=float, default=0.5, help="Mean pause between iterations, seconds")
+        parser.add_argument('--password', default='loadtest-password')
+        parser.add_argument('--pending-leaves', type=int, default=500, help="Pending leaves to top up to")
+        parser.add_argument('--no-seed', action='store_true', help="Users and leaves already exist")
+        parser.add_argument('--timeout', type=float, default=30)
+        parser.add_argument('--output', help="JSON report path (default: stdout)")
+        parser.add_argument('--max-error-rate', type=float, help="Fail if the overall error rate is higher")
+        parser.add_argument('--max-p95-ms', type=float, help="Fail if any endpoint p95 is higher")
+
+    def handle(self, *args, **options):
+        try:
+            mix = {role: float(weight) for role, weight in (part.split('=') for part in options['mix'].split(','))}
+            stages = (
+                loadtest.parse_stages(options['stages']) if options['stages']
+                else loadtest.profile_stages(options['profile'], options['users'], options['duration'], options['ramp'])
+            )
+        except ValueError:
+            raise CommandError("Invalid --mix or --stages")
+        if set(mix) - set(loadtest.ROLES):
+            raise CommandError(f"Roles are {', '.join(loadtest.ROLES)}")
+
+        peak = max(target for _, target in stages)
+        roles = loadtest.assign_roles(peak, mix)
+        counts = {role: roles.count(role) for role in loadtest.ROLES}
+        seen = dict.fromkeys(loadtest.ROLES, 0)
+        users = []
+        for role in roles:
+            users.append((role, f'{PREFIX}-{role}-{seen[role]}'))
+            seen[role] += 1
+
+        if not options['no_seed']:
+            self._seed(counts, options['password'], options['pending_leaves'])
+
+        self.stderr.write(f"{peak} virtual users {counts}, stages {stages}, against {options['base_url']}")
+        runner = loadtest.Runner(
+            options['base_url'], stages, users, options['password'], options['think'], options['timeout'],
+        )
+        report = runner.run()
+        report['config'] = {
+            'base_url': options['base_url'],
+            'stages': stages,
+            'mix': mix,
+            'users': counts,
+            'think_seconds': options['think'],
+        }
+
+        output = json.dumps(report, indent=2)
+        if options['output']:
+            with open(options['output'], 'w') as f:
+                f.write(output)
+        else:
+            self.stdout.write(output)
+        self._summary(report)
+        self._gate(report, options['max_error_rate'], options['max_p95_ms'])
+
+    @transaction.atomic
+    def _seed(self, counts, password, pending_leaves):
+        # Users, employees and leaves are saved one by one, not bulk created:
+        # the save signals write the audit entries and the directory change log
+        User = get_user_model()
+        hashed = make_password(password)
+        for role, count in counts.items():
+            names = [f'{PREFIX}-{role}-{i}' for i in range(count)]
+            existing = set(User.objects.filter(username__in=names).values_list('username', flat=True))
+            for name in names:
+                if name not in existing:
+                    User(username=name, password=hashed, role=role, email=f'{name}@loadtest.local', employee_id=name).save()
+        User.objects.filter(username__startswith=f'{PREFIX}-').update(password=hashed)
+
+        # Managers and employees need a profile to own leaves and time records
+        profiles = User.objects.filter(
+            username__startswith=f'{PREFIX}-', role__in=['manager', 'employee'], employee_profile__isnull=True,
+        )
+        for user in profiles:
+            Employee.objects.create(
+                code=user.username, nom=user.username, prenom='Load', email=user.email, poste='Load test',
+                departement='Load test', dateEmbauche=date.today(), salaire=0, user=user,
+            )
+
+        employees = list(Employee.objects.filter(code__startswith=f'{PREFIX}-employee-').values_list('id', flat=True))
+        missing = pending_leaves - LeaveRequest.objects.filter(code__startswith='LT-', statut='En attente').count()
+        if employees and missing > 0:
+            start = date.today() + timedelta(days=30)
+            for _ in range(missing):
+                LeaveRequest.objects.create(
+                    code=f'LT-{random.getrandbits(64):016x}', employe_id=random.choice(employees),
+                    debut=start, fin=start + timedelta(days=2), jours=3, type='Congé payé',
+                )
+
+    def _summary(self, report):
+        out = self.stderr
+        totals = report['totals']
+        out.write(
+            f"\n{totals['requests']} requests in {report['duration_seconds']:.1f} s, "
+            f"{totals['throughput_rps']:.1f} req/s, error rate {totals['error_rate']:.2%}"
+        )
+        out.write(f"{'endpoint':<28}{'req':>7}{'req/s':>8}{'err%':>7}{'p50':>8}{'p95':>8}{'p99':>8}  (ms)")
+        for name, stats in report['endpoints'].items():
+            latency = stats['latency_ms']
+            out.write(
+                f"{name:<28}{stats['requests']:>7}{stats['throughput_rps']:>8.1f}{stats['error_rate'] * 100:>7.1f}"
+                f"{latency['p50']:>8.1f}{latency['p95']:>8.1f}{latency['p99']:>8.1f}"
+            )
+
+    def _gate(self, report, max_error_rate, max_p95_ms):
+        failures = []
+        if max_error_rate is not None and report['totals']['error_rate'] > max_error_rate:
+            failures.append(f"error rate {report['totals']['error_rate']:.2%} > {max_error_rate:.2%}")
+        if max_p95_ms is not None:
+            for name, stats in report['endpoints'].items():
+                if stats['latency_ms']['p95'] > max_p95_ms:
+                    failures.append(f"{name} p95 {stats['latency_ms']['p95']:.1f} ms > {max_p95_ms} ms")
+        if failures:
+            raise CommandError("Load test thresholds exceeded: " + "; ".join(failures))
@@ -0,0 +1,108 @@
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+# Runs in a fresh interpreter, like a gunicorn worker booting (no --preload)
+CHILD = r'''
+import json, sys, time
+from wsgiref.util import setup_testing_defaults
+
+t0 = time.perf_counter()
+from django.core.wsgi import get_wsgi_application
+application = get_wsgi_application()
+t1 = time.perf_counter()
+
+def request(path):
+    environ = {'PATH_INFO': path, 'HTTP_HOST': sys.argv[2]}
+    setup_testing_defaults(environ)
+    status = []
+    b''.join(application(environ, lambda s, h, exc_info=None: status.append(s)))
+    return status[0]
+
+status = request(sys.argv[1])
+t2 = time.perf_counter()
+request(sys.argv[1])
+t3 = time.perf_counter()
+print(json.dumps({'setup': t1 - t0, 'first_request': t2 - t1, 'second_request': t3 - t2, 'status': status}))
+'''
+
+IMPORT_LINE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$')
+
+
+class Command(BaseCommand):
+    help = (
+        "Boots the app in a fresh interpreter with `-X importtime` and reports import "
+        "time per module / package and the time to the first request."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--path', default='/api/', help="Path of the first request")
+        parser.add_argument('--host', default='localhost')
+        parser.add_argument('--top', type=int, default=15)
+        parser.add_argument('--json', action='store_true', help="Machine-readable output")
+
+    def handle(self, *args, **options):
+        env = dict(os.environ, DJANGO_SETTINGS_MODULE=os.environ.get('DJANGO_SETTINGS_MODULE', 'config.settings'))
+        start = time.perf_counter()
+        proc = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', CHILD, options['path'], options['host']],
+            cwd=settings.BASE_DIR, env=env, capture_output=True, text=True,
+        )
+        wall = time.perf_counter() - start
+        try:
+            timings = json.loads(proc.stdout.strip().splitlines()[-1])
+        except (IndexError, ValueError):
+            raise CommandError(f"Startup failed:\n{proc.stderr[-2000:]}")
+
+        modules = []
+        packages = defaultdict(int)
+        for line in proc.stderr.splitlines():
+            match = IMPORT_LINE.match(line)
+            if match:
+                own, cumulative, _, name = match.groups()
+                modules.append((name, int(own), int(cumulative)))
+                packages[name.split('.')[0]] += int(own)
+
+        top = options['top']
+        report = {
+            'process_seconds': wall,
+            'setup_seconds': timings['setup'],
+            'first_request_seconds': timings['first_request'],
+            'second_request_seconds': timings['second_request'],
+            'first_request_status': timings['status'],
+            'import_seconds': sum(own for _, own, _ in modules) / 1e6,
+            'packages': [
+                {'name': name, 'seconds': us / 1e6}
+                for name, us in sorted(packages.items(), key=lambda item: -item[1])[:top]
+            ],
+            'modules': [
+                {'name': name, 'self_seconds': own / 1e6, 'cumulative_seconds': cumulative / 1e6}
+                for name, own, cumulative in sorted(modules, key=lambda item: -item[1])[:top]
+            ],
+        }
+        if options['json']:
+            self.stdout.write(json.dumps(report, indent=2))
+            return
+
+        self.stdout.write(f"process start to exit     {report['process_seconds'] * 1000:>9.1f} ms")
+        self.stdout.write(f"django setup (wsgi app)   {report['setup_seconds'] * 1000:>9.1f} ms")
+        self.stdout.write(
+            f"first request {options['path']:<11} {report['first_request_seconds'] * 1000:>9.1f} ms  ({timings['status']})"
+        )
+        self.stdout.write(f"second request            {report['second_request_seconds'] * 1000:>9.1f} ms")
+        self.stdout.write(f"total import time         {report['import_seconds'] * 1000:>9.1f} ms")
+        self.stdout.write("\nimport time by top-level package:")
+        for item in report['packages']:
+            self.stdout.write(f"  {item['name']:<40}{item['seconds'] * 1000:>9.1f} ms")
+        self.stdout.write("\nslowest modules (self / cumulative):")
+        for item in report['modules']:
+            self.stdout.write(
+                f"  {item['name']:<40}{item['self_seconds'] * 1000:>9.1f} ms{item['cumulative_seconds'] * 1000:>9.1f} ms"
+            )
@@ -0,0 +1,59 @@
+from django.conf import settings
+from django.utils.cache import patch_vary_headers
+
+from .compression import compress, negotiate_encoding
+
+
+class CompressionMiddleware:
+    """
+    Compresses responses according to the client's Accept-Encoding.
+
+    Supports gzip, and br / zstd when `brotli` / `zstandard` are installed.
+    Settings:
+        COMPRESSION_ENCODINGS: server preference order, default ['zstd', 'br', 'gzip']
+        COMPRESSION_MIN_SIZE: responses smaller than this (bytes) are sent as is
+        COMPRESSION_LEVELS: optional {encoding: level} overrides
+        COMPRESSION_CONTENT_TYPES: media types to compress, default ['application/json']
+
+    Only JSON is compressed by default: HTML pages (admin, browsable API)
+    carry CSRF tokens next to reflected input, the BREACH setup. gzip output
+    is also padded by a random length (see core.compression).
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.encodings = getattr(settings, 'COMPRESSION_ENCODINGS', ['zstd', 'br', 'gzip'])
+        self.min_size = getattr(settings, 'COMPRESSION_MIN_SIZE', 1024)
+        self.levels = getattr(settings, 'COMPRESSION_LEVELS', {})
+        self.content_types = set(getattr(settings, 'COMPRESSION_CONTENT_TYPES', ['application/json']))
+
+    def __call__(self, request):
+        response = self.get_response(request)
+
+        # Streaming responses are left alone, none of our endpoints stream.
+        if response.streaming or response.has_header('Content-Encoding'):
+            return response
+        if len(response.content) < self.min_size:
+            return response
+        if response.get('Content-Type', '').split(';')[0].strip().lower() not in self.content_types:
+            return response
+
+        patch_vary_headers(response, ('Accept-Encoding',))
+
+        encoding = negotiate_encoding(request.META.get('HTTP_ACCEPT_ENCODING', ''), self.encodings)
+        if encoding is None:
+            return response
+
+        compressed = compress(response.content, encoding, self.levels.get(encoding))
+        if len(compressed) >= len(response.content):
+            return response
+
+        response.content = compressed
+        response.headers['Content-Length'] = str(len(compressed))
+        response.headers['Content-Encoding'] = encoding
+
+        # Same as GZipMiddleware: the body changed, so a strong ETag becomes weak.
+        etag = response.get('ETag')
+        if etag and etag.startswith('"'):
+            response.headers['ETag'] = 'W/' + etag
+        return response
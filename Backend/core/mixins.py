@@ -0,0 +1,154 @@
+from django.conf import settings
+from django.db import transaction
+from django.http import Http404
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.throttling import ScopedRateThrottle
+
+from . import coalesce
+from .exceptions import PreconditionFailed
+from .models import StaleObjectError
+
+
+class IncludeArchivedMixin:
+    """
+    Adds `?include_archived=true` to a viewset: list returns hot rows followed
+    by the archived ones, retrieve falls back to the archive table.
+    Views define `archive_serializer_class` and `get_archive_queryset()`.
+    """
+    archive_serializer_class = None
+
+    def include_archived(self):
+        return self.request.query_params.get('include_archived', '').lower() in ('1', 'true', 'yes')
+
+    def get_archive_queryset(self):
+        raise NotImplementedError
+
+    def get_archive_serializer(self, *args, **kwargs):
+        kwargs.setdefault('context', self.get_serializer_context())
+        return self.archive_serializer_class(*args, **kwargs)
+
+    def list(self, request, *args, **kwargs):
+        if not self.include_archived():
+            return super().list(request, *args, **kwargs)
+        hot = self.get_serializer(self.filter_queryset(self.get_queryset()), many=True).data
+        archived = self.get_archive_serializer(self.get_archive_queryset(), many=True).data
+        return Response(list(hot) + list(archived))
+
+    def retrieve(self, request, *args, **kwargs):
+        try:
+            return super().retrieve(request, *args, **kwargs)
+        except Http404:
+            if not self.include_archived():
+                raise
+        instance = self.get_archive_queryset().filter(pk=kwargs[self.lookup_url_kwarg or self.lookup_field]).first()
+        if instance is None:
+            raise Http404
+        return Response(self.get_archive_serializer(instance).data)
+
+
+class OptimisticConcurrencyMixin:
+    """
+    ETag / If-Match support for viewsets of VersionedModel.
+
+    retrieve, create and update responses carry `ETag: "<version>"`. update,
+    partial_update and destroy honour `If-Match` and answer 412 when it does
+    not match; without the header the version read at the start of the request
+    is used, so a concurrent write in between still ends in a 412 rather than
+    a lost update.
+    """
+
+    def get_etag(self, instance):
+        return f'"{instance.version}"'
+
+    def check_if_match(self, instance):
+        header = self.request.headers.get('If-Match')
+        if not header or header.strip() == '*':
+            return
+        # CompressionMiddleware weakens ETags (W/"3"), accept both forms
+        tags = {tag.strip().removeprefix('W/').strip('"') for tag in header.split(',')}
+        if str(instance.version) not in tags:
+            raise PreconditionFailed()
+
+    def retrieve(self, request, *args, **kwargs):
+        instance = self.get_object()
+        response = Response(self.get_serializer(instance).data)
+        response['ETag'] = self.get_etag(instance)
+        return response
+
+    def create(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        self.perform_create(serializer)
+        headers = self.get_success_headers(serializer.data)
+        headers['ETag'] = self.get_etag(serializer.instance)
+        return Response(serializer.data, status=status.HTTP_201_CREATED, headers=headers)
+
+    def update(self, request, *args, **kwargs):
+        partial = kwargs.pop('partial', False)
+        instance = self.get_object()
+        self.check_if_match(instance)
+        serializer = self.get_serializer(instance, data=request.data, partial=partial)
+        serializer.is_valid(raise_exception=True)
+        try:
+            # Own savepoint: the failed save marks the enclosing transaction
+            # (ATOMIC_REQUESTS, tests) for rollback otherwise
+            with transaction.atomic():
+                self.perform_update(serializer)
+        except StaleObjectError:
+            raise PreconditionFailed()
+        response = Response(serializer.data)
+        response['ETag'] = self.get_etag(serializer.instance)
+        return response
+
+    def destroy(self, request, *args, **kwargs):
+        instance = self.get_object()
+        self.check_if_match(instance)
+        self.perform_destroy(instance)
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+    def perform_destroy(self, instance):
+        # Compare-and-set on version: the row is locked and re-read with the
+        # version checked above, so a write committed since then ends in a 412
+        with transaction.atomic():
+            current = (
+                type(instance)._default_manager.select_for_update()
+                .filter(pk=instance.pk, version=instance.version).first()
+            )
+            if current is None:
+                raise PreconditionFailed()
+            current.delete()
+
+
+class ScopedListThrottleMixin:
+    """
+    Applies `throttle_scope` to the list action only. Polling dashboards hit
+    the list; writes and the other actions keep the per-user rate alone so
+    that polling does not use up the budget of the user's edits.
+    """
+
+    def get_throttles(self):
+        throttles = super().get_throttles()
+        if self.action == 'list':
+            return throttles
+        return [throttle for throttle in throttles if not isinstance(throttle, ScopedRateThrottle)]
+
+
+class CoalescedListMixin:
+    """
+    Concurrent identical list requests (same path and query string, same
+    scope) share one DB query and one serialization, see core.coalesce.
+    Views whose queryset does not depend on the user can widen the scope in
+    get_coalesce_scope() so that all users share.
+    """
+
+    def get_coalesce_scope(self):
+        return self.request.user.pk
+
+    def list(self, request, *args, **kwargs):
+        if not getattr(settings, 'COALESCE_REQUESTS', True):
+            return super().list(request, *args, **kwargs)
+        key = (type(self).__name__, request.get_full_path(), self.get_coalesce_scope())
+        response = coalesce.requests.do(key, lambda: super(CoalescedListMixin, self).list(request, *args, **kwargs))
+        # Followers get a fresh Response around the shared data
+        return Response(response.data, status=response.status_code)
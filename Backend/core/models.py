@@ -0,0 +1,35 @@
+from django.db import models
+
+
+class StaleObjectError(Exception):
+    """The row was modified by someone else since it was loaded."""
+
+
+class VersionedModel(models.Model):
+    """
+    Optimistic concurrency: every save of an existing row runs
+    `UPDATE ... SET version = version + 1 WHERE id = ? AND version = ?`
+    and raises StaleObjectError when the row has moved on in the meantime.
+    Queryset .update() calls should bump the column themselves
+    (version=F('version') + 1).
+    """
+    version = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        abstract = True
+
+    def _do_update(self, base_qs, using, pk_val, values, update_fields, forced_update):
+        expected = self.version
+        version_field = self._meta.get_field('version')
+        values = [(f, model, value) for f, model, value in values if f is not version_field]
+        values.append((version_field, None, expected + 1))
+
+        if base_qs.filter(pk=pk_val, version=expected)._update(values) > 0:
+            self.version = expected + 1
+            return True
+        if base_qs.filter(pk=pk_val).exists():
+            raise StaleObjectError(
+                f"{self._meta.label} #{pk_val} was modified concurrently (expected version {expected})"
+            )
+        # Row is gone, let Model.save() fall back to an INSERT as usual
+        return False
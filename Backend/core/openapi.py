@@ -0,0 +1,31 @@
+"""
+drf-yasg objects. Only imported when the docs are used (core.schema,
+`manage.py generate_swagger`), never at URLconf import.
+"""
+from drf_yasg import openapi
+from drf_yasg.generators import OpenAPISchemaGenerator
+
+info = openapi.Info(
+    title="Entreprise API",
+    default_version='v1',
+    description="API documentation for Entreprise application",
+)
+
+
+class CachedSchemaGenerator(OpenAPISchemaGenerator):
+    """Generates the public schema once per process and version."""
+
+    _cache = {}
+
+    def __init__(self, info, version='', url=None, patterns=None, urlconf=None):
+        super().__init__(info, version, url, patterns, urlconf)
+        # The UI views pass patterns=[] for an empty shell, not worth caching
+        self._cache_key = (version, url) if patterns is None and urlconf is None else None
+
+    def get_schema(self, request=None, public=False):
+        if not public or self._cache_key is None:
+            return super().get_schema(request, public)
+        schema = self._cache.get(self._cache_key)
+        if schema is None:
+            schema = self._cache[self._cache_key] = super().get_schema(request, public)
+        return schema
@@ -0,0 +1,50 @@
+from decimal import Decimal
+
+from django.utils.functional import Promise
+from rest_framework.utils import encoders
+from rest_framework.renderers import JSONRenderer
+from rest_framework.settings import api_settings
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - falls back to the stdlib encoder
+    orjson = None
+
+
+_fallback_encoder = encoders.JSONEncoder()
+
+
+def _default(obj):
+    # orjson handles str/int/float/dict/list/date/datetime/time/UUID natively,
+    # everything else ends up here.
+    if isinstance(obj, Decimal):
+        return str(obj) if api_settings.COERCE_DECIMAL_TO_STRING else float(obj)
+    if isinstance(obj, Promise):
+        return str(obj)
+    return _fallback_encoder.default(obj)
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    Drop-in replacement for DRF's JSONRenderer backed by orjson.
+    Falls back to the stock renderer when orjson is not installed.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        if data is None:
+            return b''
+
+        renderer_context = renderer_context or {}
+        option = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+        if self.get_indent(accepted_media_type, renderer_context) is not None:
+            option |= orjson.OPT_INDENT_2
+
+        ret = orjson.dumps(data, default=_default, option=option)
+
+        # Same as JSONRenderer: keep the output a strict javascript subset.
+        if b'\xe2\x80\xa8' in ret or b'\xe2\x80\xa9' in ret:
+            ret = ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+        return ret
@@ -0,0 +1,60 @@
+"""
+Swagger / ReDoc views, built on first request instead of at URLconf import.
+
+The spec (`swagger.json`) is served from settings.API_SCHEMA_FILE when it is
+set and exists (written by `manage.py generate_swagger` at image build, see
+the Dockerfile), otherwise generated once per process by
+core.openapi.CachedSchemaGenerator.
+"""
+import os
+import threading
+
+from django.conf import settings
+from django.http import FileResponse
+
+_lock = threading.Lock()
+_schema_view = None
+
+
+def get_schema_view():
+    global _schema_view
+    if _schema_view is None:
+        with _lock:
+            if _schema_view is None:
+                from drf_yasg.views import get_schema_view as _get_schema_view
+                from rest_framework import permissions
+
+                from .openapi import CachedSchemaGenerator, info
+
+                _schema_view = _get_schema_view(
+                    info,
+                    public=True,
+                    permission_classes=(permissions.AllowAny,),
+                    generator_class=CachedSchemaGenerator,
+                )
+    return _schema_view
+
+
+def _lazy(build):
+    view = None
+
+    def wrapper(request, *args, **kwargs):
+        nonlocal view
+        if view is None:
+            view = build()
+        return view(request, *args, **kwargs)
+    return wrapper
+
+
+def schema_ui(renderer):
+    return _lazy(lambda: get_schema_view().with_ui(renderer, cache_timeout=0))
+
+
+_generated_json = _lazy(lambda: get_schema_view().without_ui(cache_timeout=0))
+
+
+def schema_json(request):
+    path = settings.API_SCHEMA_FILE
+    if path and os.path.exists(path):
+        return FileResponse(open(path, 'rb'), content_type='application/json')
+    return _generated_json(request, format='openapi')
@@ -0,0 +1,206 @@
+import threading
+import time
+from datetime import date, time as clock
+from decimal import Decimal
+from unittest import mock
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import SimpleTestCase, TestCase, TransactionTestCase, override_settings
+from rest_framework.test import APIClient
+from rest_framework.throttling import ScopedRateThrottle
+
+from projects.models import Project
+from rh.models import Employee, TimeRecord
+from rh.views import EmployeeViewSet, TimeRecordViewSet
+from users.models import CustomUser
+
+from .coalesce import SingleFlight
+
+
+class SingleFlightTests(SimpleTestCase):
+    def _concurrently(self, count, target):
+        barrier = threading.Barrier(count)
+        results = [None] * count
+
+        def worker(i):
+            barrier.wait()
+            try:
+                results[i] = target()
+            except Exception as exc:
+                results[i] = exc
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results
+
+    def test_followers_share_the_leader_result(self):
+        flight = SingleFlight()
+        calls = []
+
+        def slow():
+            calls.append(1)
+            time.sleep(0.2)
+            return object()
+
+        results = self._concurrently(8, lambda: flight.do('key', slow))
+        self.assertEqual(len(calls), 1)
+        self.assertTrue(all(result is results[0] for result in results))
+
+    def test_followers_get_the_leader_exception(self):
+        flight = SingleFlight()
+        calls = []
+
+        def failing():
+            calls.append(1)
+            time.sleep(0.2)
+            raise ValueError("boom")
+
+        results = self._concurrently(5, lambda: flight.do('key', failing))
+        self.assertEqual(len(calls), 1)
+        self.assertTrue(all(isinstance(result, ValueError) for result in results))
+
+    def test_nothing_is_cached_after_the_leader_returns(self):
+        flight = SingleFlight()
+        self.assertEqual(flight.do('key', lambda: 1), 1)
+        self.assertEqual(flight.do('key', lambda: 2), 2)
+        self.assertEqual(flight.do('other', lambda: 3), 3)
+
+
+@mock.patch.object(TimeRecordViewSet, 'throttle_classes', [])
+class CoalescedListTests(TransactionTestCase):
+    CONCURRENCY = 10
+
+    def setUp(self):
+        cache.clear()
+        self.admin = CustomUser.objects.create_user('admin', 'admin@example.com', 'pw', role='admin')
+        employee = Employee.objects.create(
+            code='E1', nom='Nom', prenom='Prenom', email='e1@example.com', poste='Dev',
+            departement='IT', dateEmbauche=date(2020, 1, 1), salaire=Decimal('1000'),
+        )
+        TimeRecord.objects.bulk_create([
+            TimeRecord(
+                employe=employee, code=f'T{i}', date=date(2024, 1, 1 + i),
+                heureEntree=clock(8), heureSortie=clock(17), heures=Decimal('8'),
+            )
+            for i in range(3)
+        ])
+
+    def _time_record_queries(self):
+        """Fires CONCURRENCY identical GETs at once, returns the SELECTs on rh_timerecord."""
+        barrier = threading.Barrier(self.CONCURRENCY)
+        lock = threading.Lock()
+        queries = []
+        statuses = []
+
+        def slow_execute(execute, sql, params, many, context):
+            if 'FROM "rh_timerecord"' in sql:
+                with lock:
+                    queries.append(sql)
+                time.sleep(0.1)  # keeps the leader in flight while the others arrive
+            return execute(sql, params, many, context)
+
+        def worker():
+            client = APIClient()
+            client.force_authenticate(self.admin)
+            try:
+                with connection.execute_wrapper(slow_execute):
+                    barrier.wait()
+                    response = client.get('/api/time-records/')
+                with lock:
+                    statuses.append((response.status_code, len(response.data)))
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=worker) for _ in range(self.CONCURRENCY)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(statuses, [(200, 3)] * self.CONCURRENCY)
+        return len(queries)
+
+    def test_concurrent_identical_gets_share_one_query(self):
+        with override_settings(COALESCE_REQUESTS=False):
+            uncoalesced = self._time_record_queries()
+        with override_settings(COALESCE_REQUESTS=True):
+            coalesced = self._time_record_queries()
+        self.assertEqual(uncoalesced, self.CONCURRENCY)
+        self.assertLess(coalesced, uncoalesced / 2)
+
+
+class OptimisticConcurrencyTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(CustomUser.objects.create_user('admin', 'admin@example.com', 'pw', role='admin'))
+        self.employee = Employee.objects.create(
+            code='E1', nom='Nom', prenom='Prenom', email='e1@example.com', poste='Dev',
+            departement='IT', dateEmbauche=date(2020, 1, 1), salaire=Decimal('1000'),
+        )
+        self.url = f'/api/employees/{self.employee.pk}/'
+
+    def _concurrent_update_after_check(self):
+        """Another request saves the employee right after the If-Match check."""
+        check = EmployeeViewSet.check_if_match
+
+        def racing(view, instance):
+            check(view, instance)
+            other = Employee.objects.get(pk=instance.pk)
+            other.salaire = Decimal('5000')
+            other.save()
+
+        return mock.patch.object(EmployeeViewSet, 'check_if_match', racing)
+
+    def test_update_with_stale_if_match(self):
+        response = self.client.patch(self.url, {'poste': 'Lead'}, format='json', HTTP_IF_MATCH='"7"')
+        self.assertEqual(response.status_code, 412)
+        self.assertEqual(Employee.objects.get(pk=self.employee.pk).poste, 'Dev')
+
+        response = self.client.patch(self.url, {'poste': 'Lead'}, format='json', HTTP_IF_MATCH='W/"0"')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['ETag'], '"1"')
+
+    def test_update_racing_a_concurrent_write(self):
+        with self._concurrent_update_after_check():
+            response = self.client.patch(self.url, {'poste': 'Lead'}, format='json')
+        self.assertEqual(response.status_code, 412)
+        self.assertEqual(Employee.objects.get(pk=self.employee.pk).poste, 'Dev')
+
+    def test_delete_with_stale_if_match(self):
+        self.assertEqual(self.client.delete(self.url, HTTP_IF_MATCH='"7"').status_code, 412)
+        self.assertTrue(Employee.objects.filter(pk=self.employee.pk).exists())
+        self.assertEqual(self.client.delete(self.url, HTTP_IF_MATCH='"0"').status_code, 204)
+        self.assertFalse(Employee.objects.filter(pk=self.employee.pk).exists())
+
+    def test_delete_racing_a_concurrent_write(self):
+        with self._concurrent_update_after_check():
+            response = self.client.delete(self.url)
+        self.assertEqual(response.status_code, 412)
+        self.assertEqual(Employee.objects.get(pk=self.employee.pk).salaire, Decimal('5000'))
+
+
+@mock.patch.dict(ScopedRateThrottle.THROTTLE_RATES, {'projects': '2/min'})
+class ScopedListThrottleTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(CustomUser.objects.create_user('boss', 'boss@example.com', 'pw', role='manager'))
+        self.project = Project.objects.create(
+            code='P1', intitule='Projet', client='Client', chefProjet='Chef',
+            dateDebut=date(2024, 1, 1), dateFin=date(2024, 12, 31),
+        )
+
+    def test_only_list_uses_the_scope(self):
+        self.assertEqual(
+            [self.client.get('/api/projects/').status_code for _ in range(3)],
+            [200, 200, 429],
+        )
+        url = f'/api/projects/{self.project.pk}/'
+        for progression in range(3):
+            self.assertEqual(self.client.patch(url, {'progression': progression}, format='json').status_code, 200)
+        self.assertEqual(self.client.get('/api/projects/portfolio/').status_code, 200)
+        self.assertEqual(self.client.get(url).status_code, 200)
@@ -0,0 +1,138 @@
+"""
+Portfolio analytics: schedule variance, late projects and roll-ups per client
+and per project manager, computed over columnar numpy arrays.
+
+Expected progress is the elapsed fraction of [dateDebut, dateFin]; variance is
+`progression - expected` in points (negative = behind schedule).
+"""
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Sum
+from django.utils import timezone
+
+import numpy as np
+
+from rh.models import ExpenseReport
+from .invalidation import generation
+from .models import Project
+
+CLOSED_STATUTS = ("Terminé", "Annulé")
+
+
+def _factorize(values):
+    # Dict based, much faster than np.unique on object arrays
+    index = {}
+    codes = np.fromiter((index.setdefault(v, len(index)) for v in values), dtype=np.int64, count=len(values))
+    return codes, list(index)
+
+
+def load_columns():
+    rows = list(Project.objects.values_list(
+        'id', 'code', 'intitule', 'client', 'chefProjet', 'dateDebut', 'dateFin', 'progression', 'statut',
+        'manager_id', 'manager__prenom', 'manager__nom',
+    ))
+    (ids, codes, titles, clients, managers, starts, ends, progress, statuts,
+     manager_ids, prenoms, noms) = zip(*rows) if rows else ([],) * 12
+
+    # Joined on ExpenseReport.project, see `manage.py backfill_project_links`
+    spent = dict(
+        ExpenseReport.objects.filter(project__isnull=False)
+        .values_list('project_id').annotate(total=Sum('montant')).order_by()
+    )
+    expenses = [float(spent.get(pk) or 0) for pk in ids]
+
+    # Group on the manager FK (stable across renames), falling back to the
+    # chefProjet string for projects that are not linked yet
+    manager_keys = [
+        f'{prenom} {nom}' if manager_id else name
+        for manager_id, prenom, nom, name in zip(manager_ids, prenoms, noms, managers)
+    ]
+    client_codes, client_labels = _factorize(clients)
+    manager_codes, manager_labels = _factorize(list(zip(manager_ids, manager_keys)))
+    manager_labels = [label for _, label in manager_labels]
+
+    return {
+        'id': np.array(ids, dtype=np.int64),
+        'code': np.array(codes, dtype=object),
+        'intitule': np.array(titles, dtype=object),
+        'client': (client_codes, client_labels),
+        'chefProjet': np.array(managers, dtype=object),
+        'manager': (manager_codes, manager_labels),
+        'start': np.array([d.toordinal() for d in starts], dtype=np.int64),
+        'end': np.array([d.toordinal() for d in ends], dtype=np.int64),
+        'progression': np.array(progress, dtype=np.float64),
+        'active': ~np.isin(np.array(statuts, dtype=object), CLOSED_STATUTS),
+        'expenses': np.array(expenses, dtype=np.float64),
+    }
+
+
+def _rollup(group, cols, late):
+    inverse, labels = group
+    n = len(labels)
+    count = np.bincount(inverse, minlength=n)
+    active = np.bincount(inverse, weights=cols['active'], minlength=n)
+    late_count = np.bincount(inverse, weights=late, minlength=n)
+    variance = np.bincount(inverse, weights=np.where(cols['active'], cols['variance'], 0), minlength=n)
+    expenses = np.bincount(inverse, weights=cols['expenses'], minlength=n)
+    return [
+        {
+            'name': labels[i],
+            'projects': int(count[i]),
+            'active': int(active[i]),
+            'late': int(late_count[i]),
+            'avgVariance': round(float(variance[i] / active[i]), 1) if active[i] else None,
+            'expenses': round(float(expenses[i]), 2),
+        }
+        for i in np.argsort(-late_count, kind='stable')
+    ]
+
+
+def compute(cols, today, late_threshold=10, top=50):
+    duration = np.maximum(cols['end'] - cols['start'], 1)
+    elapsed = np.clip((today.toordinal() - cols['start']) / duration, 0.0, 1.0)
+    expected = elapsed * 100
+    cols['variance'] = cols['progression'] - expected
+    overdue_days = np.maximum(today.toordinal() - cols['end'], 0)
+
+    late = cols['active'] & ((overdue_days > 0) | (cols['variance'] < -late_threshold))
+
+    late_idx = np.flatnonzero(late)
+    late_idx = late_idx[np.argsort(cols['variance'][late_idx], kind='stable')][:top]
+    active_count = int(cols['active'].sum())
+
+    return {
+        'date': today.isoformat(),
+        'summary': {
+            'projects': len(cols['id']),
+            'active': active_count,
+            'late': int(late.sum()),
+            'avgVariance': round(float(cols['variance'][cols['active']].mean()), 1) if active_count else None,
+            'expenses': round(float(cols['expenses'].sum()), 2),
+        },
+        'byClient': _rollup(cols['client'], cols, late),
+        'byChefProjet': _rollup(cols['manager'], cols, late),
+        'lateProjects': [
+            {
+                'id': int(cols['id'][i]),
+                'code': cols['code'][i],
+                'intitule': cols['intitule'][i],
+                'chefProjet': cols['chefProjet'][i],
+                'progression': int(cols['progression'][i]),
+                'expectedProgression': round(float(expected[i]), 1),
+                'variance': round(float(cols['variance'][i]), 1),
+                'daysOverdue': int(overdue_days[i]),
+                'expenses': round(float(cols['expenses'][i]), 2),
+            }
+            for i in late_idx
+        ],
+    }
+
+
+def portfolio(late_threshold=10, top=50):
+    today = timezone.localdate()
+    key = f'portfolio:{generation()}:{today.isoformat()}:{late_threshold}:{top}'
+    result = cache.get(key)
+    if result is None:
+        result = compute(load_columns(), today, late_threshold, top)
+        cache.set(key, result, getattr(settings, 'PORTFOLIO_CACHE_SECONDS', 300))
+    return result
@@ -0,0 +1,19 @@
+"""
+Portfolio cache generation, bumped on Project / ExpenseReport changes (see
+projects.signals). Kept apart from projects.analytics so that the signals,
+connected at boot, do not import numpy.
+"""
+from django.core.cache import cache
+
+GENERATION_KEY = 'portfolio:generation'
+
+
+def invalidate():
+    try:
+        cache.incr(GENERATION_KEY)
+    except ValueError:
+        cache.set(GENERATION_KEY, 1, None)
+
+
+def generation():
+    return cache.get(GENERATION_KEY, 0)
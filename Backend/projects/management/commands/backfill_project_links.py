@@ -0,0 +1,40 @@
+import csv
+
+from django.core.management.base import BaseCommand
+
+from projects import links
+
+
+class Command(BaseCommand):
+    help = (
+        "Links ExpenseReport.projet to Project and Project.chefProjet to Employee in chunked "
+        "batches, and reports the strings that could not be matched exactly."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000)
+        parser.add_argument('--apply-fuzzy', action='store_true',
+                            help="Also link rows whose best fuzzy suggestion passes --cutoff")
+        parser.add_argument('--cutoff', type=float, default=0.8, help="difflib similarity, 0 to 1")
+        parser.add_argument('--report', help="Write the unmatched rows to this CSV file")
+
+    def handle(self, *args, **options):
+        kwargs = dict(batch_size=options['batch_size'], apply_fuzzy=options['apply_fuzzy'], cutoff=options['cutoff'])
+        report = []
+        for name, backfill in (('expenses', links.backfill_expenses), ('projects', links.backfill_managers)):
+            linked, unmatched = backfill(**kwargs)
+            self.stdout.write(self.style.SUCCESS(f"{name}: linked {linked}, unmatched {len(unmatched)}"))
+            for pk, text, suggestion in unmatched:
+                report.append([name, pk, text, suggestion[0] if suggestion else '', suggestion[1] if suggestion else ''])
+
+        if options['report']:
+            with open(options['report'], 'w', newline='', encoding='utf-8') as fh:
+                writer = csv.writer(fh)
+                writer.writerow(['table', 'id', 'text', 'suggestion', 'suggested_id'])
+                writer.writerows(report)
+            self.stdout.write(f"Unmatched rows written to {options['report']}")
+        else:
+            for row in report[:50]:
+                self.stdout.write("  {}#{} {!r} -> {!r} ({})".format(*row))
+            if len(report) > 50:
+                self.stdout.write(f"  ... {len(report) - 50} more, use --report")
@@ -0,0 +1,86 @@
+import random
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from core.bench import bench_employee, rolled_back
+from projects import analytics
+from projects.invalidation import invalidate
+from projects.models import Project
+from rh.models import ExpenseReport
+
+
+def _compute_python(rows, today, late_threshold=10):
+    # Row-by-row reference implementation, for comparison only
+    late = 0
+    for start, end, progression, statut in rows:
+        duration = max((end - start).days, 1)
+        elapsed = min(max((today - start).days / duration, 0.0), 1.0)
+        variance = progression - elapsed * 100
+        if statut not in analytics.CLOSED_STATUTS and (today > end or variance < -late_threshold):
+            late += 1
+    return late
+
+
+class Command(BaseCommand):
+    help = "Benchmarks the portfolio analytics on synthetic projects (rolled back afterwards)."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--projects', type=int, default=50000)
+        parser.add_argument('--expenses', type=int, default=100000)
+
+    def handle(self, *args, **options):
+        with rolled_back():
+            self._seed(options['projects'], options['expenses'])
+            self._run()
+        # The cache is not rolled back: drop the synthetic portfolio
+        invalidate()
+
+    def _timed(self, label, func):
+        start = time.perf_counter()
+        result = func()
+        self.stdout.write(f"{label:<32}{(time.perf_counter() - start) * 1000:>10.1f} ms")
+        return result
+
+    def _run(self):
+        today = timezone.localdate()
+        cols = self._timed("load columns (2 queries)", analytics.load_columns)
+        result = self._timed("vectorized compute", lambda: analytics.compute(cols, today))
+        rows = list(Project.objects.values_list('dateDebut', 'dateFin', 'progression', 'statut'))
+        late = self._timed("row-by-row python (late only)", lambda: _compute_python(rows, today))
+        assert late == result['summary']['late']
+
+        invalidate()
+        self._timed("portfolio() cold", analytics.portfolio)
+        self._timed("portfolio() cached", analytics.portfolio)
+        self.stdout.write(f"{result['summary']}, {len(result['byClient'])} clients, "
+                          f"{len(result['byChefProjet'])} managers")
+
+    def _seed(self, n_projects, n_expenses):
+        rng = random.Random(42)
+        base = date.today() - timedelta(days=730)
+        statuts = ["En cours"] * 6 + ["Terminé", "En pause", "Annulé"]
+        projects = []
+        for i in range(n_projects):
+            start = base + timedelta(days=rng.randrange(700))
+            projects.append(Project(
+                code=f'bench-{i}', intitule=f'Projet {i}', client=f'Client {rng.randrange(500)}',
+                chefProjet=f'Chef {rng.randrange(200)}', dateDebut=start,
+                dateFin=start + timedelta(days=rng.randrange(30, 400)),
+                progression=rng.randrange(101), statut=rng.choice(statuts),
+            ))
+        Project.objects.bulk_create(projects, batch_size=2000)
+
+        employee = bench_employee(dateEmbauche=base)
+        expenses = []
+        for i in range(n_expenses):
+            project = projects[rng.randrange(n_projects)]
+            expenses.append(ExpenseReport(
+                code=f'bench-x-{i}', employe=employee, date=base, designation='Frais',
+                montant=Decimal(rng.randrange(1000, 50000)) / 100, projet=project.intitule, project=project,
+                type='Transport',
+            ))
+        ExpenseReport.objects.bulk_create(expenses, batch_size=2000)
@@ -0,0 +1,105 @@
+import random
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand
+from django.db.models import Sum
+
+from core.bench import rolled_back
+from projects import links
+from projects.models import Project
+from rh.models import Employee, ExpenseReport
+
+
+class Command(BaseCommand):
+    help = (
+        "Compares string matching on ExpenseReport.projet / Project.chefProjet with the "
+        "foreign key joins, on synthetic data that is rolled back afterwards."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--projects', type=int, default=5000)
+        parser.add_argument('--employees', type=int, default=500)
+        parser.add_argument('--expenses', type=int, default=200000)
+        parser.add_argument('--lookups', type=int, default=200, help="Single-object lookups per case")
+
+    def handle(self, *args, **options):
+        with rolled_back():
+            self._seed(options['projects'], options['employees'], options['expenses'])
+            self._run(options['lookups'])
+
+    def _compare(self, label, by_string, by_fk):
+        timings = []
+        for func in (by_string, by_fk):
+            start = time.perf_counter()
+            func()
+            timings.append((time.perf_counter() - start) * 1000)
+        self.stdout.write(
+            f"{label:<34}{timings[0]:>10.1f} ms {timings[1]:>10.1f} ms {timings[0] / max(timings[1], 1e-6):>8.1f}x"
+        )
+
+    def _run(self, lookups):
+        rng = random.Random(1)
+        projects = list(Project.objects.values_list('id', 'intitule', 'manager_id', 'chefProjet'))
+        sample = [rng.choice(projects) for _ in range(lookups)]
+
+        self.stdout.write(f"{'':<34}{'string':>13} {'foreign key':>13} {'speedup':>9}")
+        self._compare(
+            f"cost of one project x{lookups}",
+            lambda: [ExpenseReport.objects.filter(projet=title).aggregate(Sum('montant')) for _, title, _, _ in sample],
+            lambda: [ExpenseReport.objects.filter(project_id=pk).aggregate(Sum('montant')) for pk, _, _, _ in sample],
+        )
+        self._compare(
+            f"projects of one manager x{lookups}",
+            lambda: [list(Project.objects.filter(chefProjet=name).values_list('id')) for _, _, _, name in sample],
+            lambda: [list(Project.objects.filter(manager_id=mid).values_list('id')) for _, _, mid, _ in sample],
+        )
+
+        def costs_by_string():
+            spent = dict(ExpenseReport.objects.values_list('projet').annotate(Sum('montant')).order_by())
+            return {pk: spent.get(title) for pk, title, _, _ in projects}
+
+        def costs_by_fk():
+            spent = dict(ExpenseReport.objects.values_list('project_id').annotate(Sum('montant')).order_by())
+            return {pk: spent.get(pk) for pk, _, _, _ in projects}
+
+        self._compare("cost of every project", costs_by_string, costs_by_fk)
+        self._compare(
+            "cost of every project (join)",
+            costs_by_string,
+            lambda: list(Project.objects.annotate(total=Sum('expenses__montant')).values_list('id', 'total')),
+        )
+
+        start = time.perf_counter()
+        ExpenseReport.objects.update(project=None)
+        Project.objects.update(manager=None)
+        linked = links.backfill_expenses()[0] + links.backfill_managers()[0]
+        self.stdout.write(f"backfill of {linked} rows: {(time.perf_counter() - start) * 1000:.0f} ms")
+
+    def _seed(self, n_projects, n_employees, n_expenses):
+        rng = random.Random(42)
+        base = date.today() - timedelta(days=365)
+        employees = Employee.objects.bulk_create([
+            Employee(
+                code=f'bench-emp-{i}', nom=f'Nom{i}', prenom=f'Prenom{i}', email=f'bench{i}@example.com',
+                poste='Chef de projet', departement='Projets', dateEmbauche=base, salaire=Decimal('4000.00'),
+            )
+            for i in range(n_employees)
+        ])
+        projects = []
+        for i in range(n_projects):
+            manager = rng.choice(employees)
+            projects.append(Project(
+                code=f'bench-{i}', intitule=f'Projet {i}', client='Client', manager=manager,
+                chefProjet=f'{manager.prenom} {manager.nom}', dateDebut=base, dateFin=base + timedelta(days=365),
+            ))
+        Project.objects.bulk_create(projects, batch_size=2000)
+        expenses = []
+        for i in range(n_expenses):
+            project = rng.choice(projects)
+            expenses.append(ExpenseReport(
+                code=f'bench-x-{i}', employe=employees[0], date=base, designation='Frais',
+                montant=Decimal('12.50'), projet=project.intitule, project=project, type='Repas',
+            ))
+        ExpenseReport.objects.bulk_create(expenses, batch_size=2000)
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.9 on 2026-10-19 12:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='project',
+            name='version',
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
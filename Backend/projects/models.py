@@ -1,6 +1,8 @@
 from django.db import models
 
-class Project(models.Model):
+from core.models import VersionedModel
+
+class Project(VersionedModel):
     STATUT_CHOICES = [
         ("En cours", "En cours"),
         ("Terminé", "Terminé"),
@@ -12,6 +14,8 @@ class Project(models.Model):
     intitule = models.CharField(max_length=200)
     client = models.CharField(max_length=100)
     chefProjet = models.CharField(max_length=100) # Storing name as per frontend
+    # Filled from `chefProjet` by the serializer / `manage.py backfill_project_links`
+    manager = models.ForeignKey('rh.Employee', on_delete=models.SET_NULL, null=True, blank=True, related_name="managed_projects")
     dateDebut = models.DateField()
     dateFin = models.DateField()
     description = models.TextField(blank=True, null=True)
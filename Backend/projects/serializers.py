@@ -1,5 +1,6 @@
 from rest_framework import serializers
 from .models import Project, ProjectDoc
+from .links import find_employee
 
 class ProjectDocSerializer(serializers.ModelSerializer):
     id = serializers.CharField(read_only=True)
@@ -15,7 +16,19 @@ class ProjectSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Project
-        fields = ['id', 'code', 'intitule', 'client', 'chefProjet', 'dateDebut', 'dateFin', 'description', 'progression', 'statut', 'stats', 'docsList']
+        fields = ['id', 'code', 'intitule', 'client', 'chefProjet', 'dateDebut', 'dateFin', 'description', 'progression', 'statut', 'manager', 'version', 'stats', 'docsList']
+        read_only_fields = ['version']
+        extra_kwargs = {'chefProjet': {'required': False}}
+
+    def validate(self, attrs):
+        # Either side may be sent, keep the name and the foreign key in step
+        if attrs.get('manager') and not attrs.get('chefProjet'):
+            attrs['chefProjet'] = f"{attrs['manager'].prenom} {attrs['manager'].nom}"
+        elif attrs.get('chefProjet') and 'manager' not in attrs:
+            attrs['manager'] = find_employee(attrs['chefProjet'])
+        if self.instance is None and not attrs.get('chefProjet'):
+            raise serializers.ValidationError({'chefProjet': "Provide chefProjet or manager."})
+        return attrs
     
     def get_stats(self, obj):
         # Mock calculation or based on actual docs types
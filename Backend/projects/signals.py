@@ -0,0 +1,15 @@
+from django.db.models.signals import post_delete, post_save
+
+from rh.models import ExpenseReport
+from .invalidation import invalidate
+from .models import Project
+
+
+def _invalidate_portfolio(sender, **kwargs):
+    invalidate()
+
+
+def connect():
+    for model in (Project, ExpenseReport):
+        post_save.connect(_invalidate_portfolio, sender=model, dispatch_uid=f'portfolio:save:{model.__name__}')
+        post_delete.connect(_invalidate_portfolio, sender=model, dispatch_uid=f'portfolio:delete:{model.__name__}')
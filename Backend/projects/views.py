@@ -1,10 +1,58 @@
+from django.db.models import Count, Sum
 from rest_framework import viewsets
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
 from .models import Project, ProjectDoc
 from .serializers import ProjectSerializer, ProjectDocSerializer
+from core.mixins import CoalescedListMixin, OptimisticConcurrencyMixin, ScopedListThrottleMixin
+from users.permissions import IsManager
 
-class ProjectViewSet(viewsets.ModelViewSet):
+class ProjectViewSet(ScopedListThrottleMixin, CoalescedListMixin, OptimisticConcurrencyMixin, viewsets.ModelViewSet):
     queryset = Project.objects.all()
     serializer_class = ProjectSerializer
+    throttle_scope = 'projects'
+
+    def get_coalesce_scope(self):
+        return 'all'  # projects are not filtered per user
+
+    def get_queryset(self):
+        queryset = Project.objects.all()
+        manager = self.request.query_params.get('manager')
+        if manager:
+            # Indexed FK filter, replaces matching on the chefProjet string
+            try:
+                queryset = queryset.filter(manager_id=int(manager))
+            except ValueError:
+                raise ValidationError({'manager': "Must be an employee id."})
+        return queryset
+
+    @action(detail=False, methods=['get'], permission_classes=[IsManager])
+    def costs(self, request):
+        """Expense totals per project through the ExpenseReport.project join. ?manager=<employee id>"""
+        rows = (
+            self.get_queryset()
+            .annotate(expensesTotal=Sum('expenses__montant'), expenseCount=Count('expenses'))
+            .values('id', 'code', 'intitule', 'manager', 'expensesTotal', 'expenseCount')
+            .order_by('code')
+        )
+        return Response(list(rows))
+
+    @action(detail=False, methods=['get'], permission_classes=[IsManager])
+    def portfolio(self, request):
+        """
+        Late projects, schedule variance and roll-ups per client / chefProjet.
+        ?late_threshold=10 (points behind expected progress), ?top=50 (late projects listed)
+        """
+        try:
+            late_threshold = int(request.query_params.get('late_threshold', 10))
+            top = min(int(request.query_params.get('top', 50)), 500)
+        except ValueError:
+            raise ValidationError("late_threshold and top must be integers.")
+        if top < 0:
+            raise ValidationError({'top': "Must be 0 or more."})
+        from . import analytics  # numpy, imported on first use to keep it out of worker boot
+        return Response(analytics.portfolio(late_threshold, top))
 
 class ProjectDocViewSet(viewsets.ModelViewSet):
     queryset = ProjectDoc.objects.all()
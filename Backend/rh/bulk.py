@@ -0,0 +1,154 @@
+"""
+Bulk statut transitions for LeaveRequest, ExpenseReport and Authorization.
+
+Per model: one SELECT to validate, one conditional UPDATE per target statut
+(`WHERE id IN (...) AND statut = <from> RETURNING id`), then one bulk insert
+of notifications. Only the ids the UPDATE returned are applied, rows whose
+statut changed concurrently are reported as conflicts instead of being
+overwritten or claimed.
+"""
+from collections import defaultdict
+
+from django.db import connection, transaction
+from django.db.models import F
+
+from audit import log as audit_log
+from audit.signals import tracked_fields
+from users.models import Notification
+from .models import LeaveRequest, ExpenseReport, Authorization
+
+# request "type" -> (model, label used in notifications, {target statut: notification title}).
+# The titles are spelled out because the statut has to agree with the label.
+MODELS = {
+    'leaves': (LeaveRequest, "Demande de congé", {
+        "Approuvé": "Demande de congé approuvée",
+        "Refusé": "Demande de congé refusée",
+    }),
+    'expenses': (ExpenseReport, "Note de frais", {
+        "Validé": "Note de frais validée",
+        "Refusé": "Note de frais refusée",
+    }),
+    'authorizations': (Authorization, "Autorisation", {
+        "Approuvé": "Autorisation approuvée",
+        "Refusé": "Autorisation refusée",
+    }),
+}
+
+APPLIED = 'applied'
+NOT_FOUND = 'not_found'
+INVALID_TRANSITION = 'invalid_transition'
+CONFLICT = 'conflict'
+
+UPDATE_CHUNK = 500  # ids per UPDATE, below SQLite's bound parameter limit
+
+
+def _can_return_from_update():
+    # PostgreSQL, and SQLite >= 3.35 (same version gate as INSERT ... RETURNING)
+    return connection.vendor == 'postgresql' or (
+        connection.vendor == 'sqlite' and connection.features.can_return_columns_from_insert
+    )
+
+
+def _update(model, ids, source, target):
+    """Moves `ids` from `source` to `target`, returns the ids actually updated."""
+    if not _can_return_from_update():
+        # One conditional UPDATE per row, its count says whether this one
+        # applied. SELECT FOR UPDATE is a no-op on SQLite, so rows may have
+        # moved since _transition_model read them.
+        return {
+            pk for pk in ids
+            if model.objects.filter(pk=pk, statut=source).update(statut=target, version=F('version') + 1)
+        }
+
+    quote = connection.ops.quote_name
+    opts = model._meta
+    statut, version, pk = (quote(opts.get_field(name).column) for name in ('statut', 'version', 'id'))
+    done = set()
+    with connection.cursor() as cursor:
+        for start in range(0, len(ids), UPDATE_CHUNK):
+            chunk = ids[start:start + UPDATE_CHUNK]
+            cursor.execute(
+                f"UPDATE {quote(opts.db_table)} SET {statut} = %s, {version} = {version} + 1 "
+                f"WHERE {pk} IN ({', '.join(['%s'] * len(chunk))}) AND {statut} = %s RETURNING {pk}",
+                [target, *chunk, source],
+            )
+            done.update(row[0] for row in cursor.fetchall())
+    return done
+
+
+def _transition_model(model, requested):
+    """
+    `requested` is {id: target statut}. Returns ({id: (result, statut)}, [applied rows]).
+    """
+    rows = {
+        row['id']: row
+        for row in model.objects.filter(pk__in=requested).select_for_update(of=('self',))
+        .values('id', 'code', 'statut', 'employe__user_id')
+    }
+
+    results = {}
+    groups = defaultdict(list)  # (from, to) -> ids
+    for pk, target in requested.items():
+        row = rows.get(pk)
+        if row is None:
+            results[pk] = (NOT_FOUND, None)
+        elif target not in model.STATUT_TRANSITIONS.get(row['statut'], ()):
+            results[pk] = (INVALID_TRANSITION, row['statut'])
+        else:
+            groups[(row['statut'], target)].append(pk)
+
+    applied = []
+    for (source, target), ids in groups.items():
+        updated = _update(model, ids, source, target)
+        current = {} if len(updated) == len(ids) else dict(
+            # Someone else moved some of these rows since the SELECT above
+            model.objects.filter(pk__in=ids).exclude(pk__in=updated).values_list('id', 'statut')
+        )
+        for pk in ids:
+            if pk in updated:
+                results[pk] = (APPLIED, target)
+                applied.append((rows[pk], source, target))
+            else:
+                results[pk] = (CONFLICT, current.get(pk))
+    return results, applied
+
+
+def bulk_transition(items):
+    """
+    `items` is a list of {'type', 'id', 'statut'}. Returns one result dict per
+    item, in the same order.
+    """
+    by_type = defaultdict(dict)
+    for item in items:
+        by_type[item['type']][item['id']] = item['statut']
+
+    results = {}
+    notifications = []
+    with transaction.atomic():
+        for type_, requested in by_type.items():
+            model, label, titles = MODELS[type_]
+            model_results, applied = _transition_model(model, requested)
+            results.update({(type_, pk): result for pk, result in model_results.items()})
+
+            audited = 'statut' in tracked_fields(model)
+            for row, source, target in applied:
+                # The queryset update() skips the save signals, so log it here
+                if audited:
+                    audit_log.record('update', model(pk=row['id']), {'statut': [source, target]})
+                if row['employe__user_id']:
+                    notifications.append(Notification(
+                        user_id=row['employe__user_id'],
+                        title=titles[target],
+                        message=f"{label} {row['code']} : {target}",
+                    ))
+        Notification.objects.bulk_create(notifications)
+
+    return [
+        {
+            'type': item['type'],
+            'id': item['id'],
+            'result': results[(item['type'], item['id'])][0],
+            'statut': results[(item['type'], item['id'])][1],
+        }
+        for item in items
+    ]
@@ -0,0 +1,139 @@
+"""
+Employee / user directory sync: a full snapshot, then deltas.
+
+Every save or delete of an Employee / CustomUser that touches a directory
+column writes a DirectoryChange row in the same transaction (rh.signals).
+Each response carries a signed `token`; `?since=<token>` returns the current
+state of the objects changed since then, and the ids deleted since then.
+
+The token holds the highest change id seen plus the ids below it that were
+missing at the time (gaps). Ids are handed out at insert time, not at commit,
+so a gap is either a rolled-back change or a transaction still in flight;
+gaps are looked up again on every sync until they show up or are older than
+DIRECTORY_SYNC_GAP_SECONDS. A transaction that commits later than that after
+writing its change is missed by delta clients, so keep the window above the
+longest import / migration transaction. Tokens older than the change log
+retention (DIRECTORY_CHANGE_DAYS) get a full snapshot.
+"""
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core import signing
+from django.db.models import F, Max, Min, Q
+from django.utils import timezone
+
+from .models import DirectoryChange, Employee
+
+SALT = 'rh.directory'
+
+# Compact payload: what a directory / badge client needs, no salary
+EMPLOYEE_FIELDS = ('id', 'code', 'nom', 'prenom', 'email', 'poste', 'departement', 'statut', 'user')
+USER_FIELDS = {
+    'firstName': F('first_name'),
+    'lastName': F('last_name'),
+    'employeeId': F('employee_id'),
+    'isActive': F('is_active'),
+}
+# Model fields behind the payload, saves touching none of them are not logged
+EMPLOYEE_COLUMNS = {'code', 'nom', 'prenom', 'email', 'poste', 'departement', 'statut', 'user', 'user_id'}
+USER_COLUMNS = {'username', 'email', 'role', 'departement', 'first_name', 'last_name', 'employee_id', 'is_active'}
+
+
+class InvalidToken(Exception):
+    pass
+
+
+def make_token(seq, gaps):
+    return signing.dumps({'s': seq, 'g': sorted(gaps.items())}, salt=SALT, compress=True)
+
+
+def parse_token(token):
+    """Returns (last change id seen, {missing id: unix time first seen})."""
+    try:
+        data = signing.loads(token, salt=SALT)
+        return int(data['s']), {int(pk): float(seen) for pk, seen in data['g']}
+    except (signing.BadSignature, KeyError, TypeError, ValueError):
+        raise InvalidToken(token)
+
+
+def _employees():
+    return Employee.objects.order_by('id').values(*EMPLOYEE_FIELDS)
+
+
+def _users():
+    return (
+        get_user_model().objects.order_by('id')
+        .values('id', 'username', 'email', 'role', 'departement', **USER_FIELDS)
+    )
+
+
+def _missing(low, high):
+    """Change ids in (low, high] that are not visible (yet)."""
+    if high <= low:
+        return set()
+    present = DirectoryChange.objects.filter(id__gt=low, id__lte=high).values_list('id', flat=True)
+    return set(range(low + 1, high + 1)) - set(present)
+
+
+def snapshot():
+    now = time.time()
+    seq = DirectoryChange.objects.aggregate(seq=Max('id'))['seq'] or 0
+    # Only the ids handed out within the gap window can still be in flight
+    recent = DirectoryChange.objects.filter(
+        changed_at__gte=timezone.now() - timedelta(seconds=settings.DIRECTORY_SYNC_GAP_SECONDS),
+    ).aggregate(low=Min('id'))['low']
+    gaps = dict.fromkeys(_missing(recent - 1, seq), now) if recent else {}
+    return {
+        'token': make_token(seq, gaps),
+        'full': True,
+        'employees': list(_employees()),
+        'users': list(_users()),
+        'deleted': {'employees': [], 'users': []},
+    }
+
+
+def sync(since=None):
+    if since is None:
+        return snapshot()
+    seq, gaps = since
+    first = DirectoryChange.objects.aggregate(first=Min('id'))['first']
+    if first is not None and seq < first - 1:
+        return snapshot()  # changes after `seq` may have been purged
+
+    now = time.time()
+    latest = DirectoryChange.objects.aggregate(seq=Max('id'))['seq'] or 0
+    changes = (
+        DirectoryChange.objects.filter(Q(id__gt=seq, id__lte=latest) | Q(id__in=list(gaps)))
+        .order_by('id').values_list('id', 'kind', 'object_id', 'deleted')
+    )
+    state = {}
+    seen = set()
+    for pk, kind, object_id, deleted in changes:
+        seen.add(pk)
+        state[(kind, object_id)] = deleted  # the latest change wins
+
+    horizon = now - settings.DIRECTORY_SYNC_GAP_SECONDS
+    gaps = {pk: first_seen for pk, first_seen in gaps.items() if pk not in seen and first_seen >= horizon}
+    gaps.update(dict.fromkeys(_missing(seq, latest) - seen, now))
+
+    def ids(kind, deleted):
+        return sorted(object_id for (k, object_id), d in state.items() if k == kind and d == deleted)
+
+    return {
+        'token': make_token(max(seq, latest), gaps),
+        'full': False,
+        'employees': list(_employees().filter(id__in=ids('employee', False))),
+        'users': list(_users().filter(id__in=ids('user', False))),
+        'deleted': {'employees': ids('employee', True), 'users': ids('user', True)},
+    }
+
+
+def purge_changes(days=None):
+    days = settings.DIRECTORY_CHANGE_DAYS if days is None else days
+    old = DirectoryChange.objects.filter(changed_at__lt=timezone.now() - timedelta(days=days))
+    # The newest row stays, it carries the sequence high-water mark
+    latest = DirectoryChange.objects.aggregate(seq=Max('id'))['seq']
+    deleted, _ = old.exclude(id=latest).delete()
+    return deleted
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from rh.directory import purge_changes
+
+
+class Command(BaseCommand):
+    help = "Deletes directory change log rows older than DIRECTORY_CHANGE_DAYS (older sync tokens get a full snapshot)."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, help="Override DIRECTORY_CHANGE_DAYS")
+
+    def handle(self, *args, **options):
+        deleted = purge_changes(options['days'])
+        self.stdout.write(f"Deleted {deleted} directory changes")
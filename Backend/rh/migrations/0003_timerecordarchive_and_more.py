@@ -0,0 +1,43 @@
+# Generated by Django 5.2.9 on 2026-10-19 12:08
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('rh', '0002_employee_user'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TimeRecordArchive',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('code', models.CharField(max_length=50, unique=True)),
+                ('date', models.DateField()),
+                ('heureEntree', models.TimeField()),
+                ('heureSortie', models.TimeField()),
+                ('lieu', models.CharField(default='Bureau', max_length=100)),
+                ('heures', models.DecimalField(decimal_places=2, max_digits=5)),
+                ('type', models.CharField(default='Normal', max_length=50)),
+                ('statut', models.CharField(default='Présent', max_length=50)),
+                ('hsValide', models.BooleanField(default=False)),
+                ('archived_at', models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='timerecord',
+            index=models.Index(fields=['date'], name='rh_timereco_date_a82ae3_idx'),
+        ),
+        migrations.AddField(
+            model_name='timerecordarchive',
+            name='employe',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='archived_time_records', to='rh.employee'),
+        ),
+        migrations.AddIndex(
+            model_name='timerecordarchive',
+            index=models.Index(fields=['employe', 'date'], name='rh_timereco_employe_11d77d_idx'),
+        ),
+    ]
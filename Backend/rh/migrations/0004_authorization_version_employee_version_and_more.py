@@ -0,0 +1,38 @@
+# Generated by Django 5.2.9 on 2026-10-19 12:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('rh', '0003_timerecordarchive_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='authorization',
+            name='version',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='employee',
+            name='version',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='expensereport',
+            name='version',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='leaverequest',
+            name='version',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='timerecord',
+            name='version',
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
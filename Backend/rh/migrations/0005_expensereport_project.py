@@ -0,0 +1,20 @@
+# Generated by Django 5.2.9 on 2026-10-19 12:13
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0003_project_manager'),
+        ('rh', '0004_authorization_version_employee_version_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='expensereport',
+            name='project',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='expenses', to='projects.project'),
+        ),
+    ]
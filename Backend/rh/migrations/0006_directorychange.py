@@ -0,0 +1,26 @@
+# Generated by Django 5.2.9 on 2026-10-19 13:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('rh', '0005_expensereport_project'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DirectoryChange',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('employee', 'Employee'), ('user', 'User')], max_length=20)),
+                ('object_id', models.BigIntegerField()),
+                ('deleted', models.BooleanField(default=False)),
+                ('changed_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['changed_at'], name='rh_director_changed_6c8a52_idx')],
+            },
+        ),
+    ]
@@ -1,6 +1,8 @@
 from django.db import models
 
-class Employee(models.Model):
+from core.models import VersionedModel
+
+class Employee(VersionedModel):
     STATUT_CHOICES = [
         ("Actif", "Actif"),
         ("Inactif", "Inactif"),
@@ -24,12 +26,16 @@ class Employee(models.Model):
         return f"{self.nom} {self.prenom}"
 
 
-class LeaveRequest(models.Model):
+class LeaveRequest(VersionedModel):
     STATUT_CHOICES = [
         ("En attente", "En attente"),
         ("Approuvé", "Approuvé"),
         ("Refusé", "Refusé"),
     ]
+    # Allowed statut changes, used by the bulk transition endpoint
+    STATUT_TRANSITIONS = {
+        "En attente": ["Approuvé", "Refusé"],
+    }
 
     code = models.CharField(max_length=50, unique=True)
     employe = models.ForeignKey(Employee, on_delete=models.CASCADE, related_name="leaves")
@@ -44,7 +50,7 @@ class LeaveRequest(models.Model):
     def __str__(self):
         return f"{self.code} - {self.employe}"
 
-class TimeRecord(models.Model):
+class TimeRecord(VersionedModel):
     employe = models.ForeignKey(Employee, on_delete=models.CASCADE, related_name="time_records")
     code = models.CharField(max_length=50, unique=True) # To match frontend ID/Code
     date = models.DateField()
@@ -56,34 +62,68 @@ class TimeRecord(models.Model):
     statut = models.CharField(max_length=50, default="Présent")
     hsValide = models.BooleanField(default=False)
 
+    class Meta:
+        indexes = [models.Index(fields=['date'])]  # archive_records scans by date
+
+    def __str__(self):
+        return f"{self.employe} - {self.date}"
+
+class TimeRecordArchive(models.Model):
+    # Rows moved out of TimeRecord by `manage.py archive_records`, same ids
+    id = models.BigIntegerField(primary_key=True)
+    employe = models.ForeignKey(Employee, on_delete=models.CASCADE, related_name="archived_time_records")
+    code = models.CharField(max_length=50, unique=True)
+    date = models.DateField()
+    heureEntree = models.TimeField()
+    heureSortie = models.TimeField()
+    lieu = models.CharField(max_length=100, default="Bureau")
+    heures = models.DecimalField(max_digits=5, decimal_places=2)
+    type = models.CharField(max_length=50, default="Normal")
+    statut = models.CharField(max_length=50, default="Présent")
+    hsValide = models.BooleanField(default=False)
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [models.Index(fields=['employe', 'date'])]
+
     def __str__(self):
         return f"{self.employe} - {self.date}"
 
-class ExpenseReport(models.Model):
+class ExpenseReport(VersionedModel):
     STATUT_CHOICES = [
         ("En attente", "En attente"),
         ("Validé", "Validé"),
         ("Refusé", "Refusé"),
     ]
+    # Allowed statut changes, used by the bulk transition endpoint
+    STATUT_TRANSITIONS = {
+        "En attente": ["Validé", "Refusé"],
+    }
 
     code = models.CharField(max_length=50, unique=True)
     employe = models.ForeignKey(Employee, on_delete=models.CASCADE, related_name="expenses")
     date = models.DateField()
     designation = models.CharField(max_length=200)
     montant = models.DecimalField(max_digits=10, decimal_places=2)
-    projet = models.CharField(max_length=100) # Storing as string for now, could be FK
+    projet = models.CharField(max_length=100) # Project title as typed, kept for display
+    # Filled from `projet` by the serializer / `manage.py backfill_project_links`
+    project = models.ForeignKey('projects.Project', on_delete=models.SET_NULL, null=True, blank=True, related_name="expenses")
     type = models.CharField(max_length=50) # e.g. "Transport", "Repas"
     statut = models.CharField(max_length=20, choices=STATUT_CHOICES, default="En attente")
     
     def __str__(self):
         return f"{self.code} - {self.montant}"
 
-class Authorization(models.Model):
+class Authorization(VersionedModel):
     STATUT_CHOICES = [
         ("En attente", "En attente"),
         ("Approuvé", "Approuvé"),
         ("Refusé", "Refusé"),
     ]
+    # Allowed statut changes, used by the bulk transition endpoint
+    STATUT_TRANSITIONS = {
+        "En attente": ["Approuvé", "Refusé"],
+    }
 
     code = models.CharField(max_length=50, unique=True)
     employe = models.ForeignKey(Employee, on_delete=models.CASCADE, related_name="authorizations")
@@ -95,3 +135,23 @@ class Authorization(models.Model):
 
     def __str__(self):
         return f"{self.code} - {self.employe}"
+
+
+class DirectoryChange(models.Model):
+    # Change log of Employee / CustomUser rows for the directory delta sync,
+    # written in the same transaction as the change (see rh.signals, rh.directory)
+    KIND_CHOICES = [
+        ("employee", "Employee"),
+        ("user", "User"),
+    ]
+
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES)
+    object_id = models.BigIntegerField()
+    deleted = models.BooleanField(default=False)
+    changed_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [models.Index(fields=['changed_at'])]  # gap window and purge
+
+    def __str__(self):
+        return f"{self.kind} {self.object_id}"
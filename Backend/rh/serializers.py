@@ -1,7 +1,8 @@
 from rest_framework import serializers
-from .models import Employee, LeaveRequest, TimeRecord, ExpenseReport, Authorization
+from .models import Employee, LeaveRequest, TimeRecord, TimeRecordArchive, ExpenseReport, Authorization
 from django.contrib.auth import get_user_model
 from django.db import transaction
+from projects.links import find_project
 
 User = get_user_model()
 
@@ -11,7 +12,7 @@ class EmployeeSerializer(serializers.ModelSerializer):
     class Meta:
         model = Employee
         fields = '__all__'
-        extra_kwargs = {'user': {'read_only': True}}
+        extra_kwargs = {'user': {'read_only': True}, 'version': {'read_only': True}}
     
     def create(self, validated_data):
         password = validated_data.pop('password', None)
@@ -48,13 +49,20 @@ class LeaveRequestSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = LeaveRequest
-        fields = ['id', 'code', 'employe', 'debut', 'fin', 'jours', 'type', 'motif', 'statut']
+        fields = ['id', 'code', 'employe', 'debut', 'fin', 'jours', 'type', 'motif', 'statut', 'version']
+        read_only_fields = ['version']
 
 class TimeRecordSerializer(serializers.ModelSerializer):
     employe = serializers.StringRelatedField()
 
     class Meta:
         model = TimeRecord
+        fields = ['id', 'code', 'employe', 'date', 'heureEntree', 'heureSortie', 'lieu', 'heures', 'type', 'statut', 'hsValide', 'version']
+        read_only_fields = ['version']
+
+class TimeRecordArchiveSerializer(TimeRecordSerializer):
+    class Meta(TimeRecordSerializer.Meta):
+        model = TimeRecordArchive
         fields = ['id', 'code', 'employe', 'date', 'heureEntree', 'heureSortie', 'lieu', 'heures', 'type', 'statut', 'hsValide']
 
 class ExpenseReportSerializer(serializers.ModelSerializer):
@@ -62,11 +70,41 @@ class ExpenseReportSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = ExpenseReport
-        fields = ['id', 'code', 'employe', 'date', 'designation', 'montant', 'projet', 'type', 'statut']
+        fields = ['id', 'code', 'employe', 'date', 'designation', 'montant', 'projet', 'project', 'type', 'statut', 'version']
+        read_only_fields = ['version']
+        extra_kwargs = {'projet': {'required': False}}
+
+    def validate(self, attrs):
+        # Either side may be sent, keep the title and the foreign key in step
+        if attrs.get('project') and not attrs.get('projet'):
+            attrs['projet'] = attrs['project'].intitule
+        elif attrs.get('projet') and 'project' not in attrs:
+            attrs['project'] = find_project(attrs['projet'])
+        if self.instance is None and not attrs.get('projet'):
+            raise serializers.ValidationError({'projet': "Provide projet or project."})
+        return attrs
 
 class AuthorizationSerializer(serializers.ModelSerializer):
     employe = serializers.StringRelatedField()
 
     class Meta:
         model = Authorization
-        fields = ['id', 'code', 'employe', 'date', 'duree', 'type', 'motif', 'statut']
+        fields = ['id', 'code', 'employe', 'date', 'duree', 'type', 'motif', 'statut', 'version']
+        read_only_fields = ['version']
+
+class BulkTransitionItemSerializer(serializers.Serializer):
+    type = serializers.ChoiceField(choices=['leaves', 'expenses', 'authorizations'])
+    id = serializers.IntegerField()
+    statut = serializers.CharField(max_length=20)
+
+class BulkTransitionSerializer(serializers.Serializer):
+    items = BulkTransitionItemSerializer(many=True, allow_empty=False, max_length=1000)
+
+    def validate_items(self, items):
+        seen = set()
+        for item in items:
+            key = (item['type'], item['id'])
+            if key in seen:
+                raise serializers.ValidationError(f"Duplicate item {item['type']} #{item['id']}.")
+            seen.add(key)
+        return items
@@ -0,0 +1,43 @@
+from django.contrib.auth import get_user_model
+from django.db.models.signals import post_delete, post_save, pre_delete
+
+from .directory import EMPLOYEE_COLUMNS, USER_COLUMNS
+from .models import DirectoryChange, Employee
+
+
+def _changed(kind, columns):
+    def handler(sender, instance, update_fields=None, **kwargs):
+        # e.g. update_last_login() saves only last_login, not a directory change
+        if update_fields is not None and not set(update_fields) & columns:
+            return
+        DirectoryChange.objects.create(kind=kind, object_id=instance.pk)
+    return handler
+
+
+def _deleted(kind):
+    def handler(sender, instance, **kwargs):
+        DirectoryChange.objects.create(kind=kind, object_id=instance.pk, deleted=True)
+    return handler
+
+
+def _user_deleting(sender, instance, **kwargs):
+    # Employee.user is SET_NULL through a queryset update, which skips post_save
+    DirectoryChange.objects.bulk_create([
+        DirectoryChange(kind='employee', object_id=pk)
+        for pk in Employee.objects.filter(user=instance).values_list('pk', flat=True)
+    ])
+
+
+_employee_saved = _changed('employee', EMPLOYEE_COLUMNS)
+_user_saved = _changed('user', USER_COLUMNS)
+_employee_deleted = _deleted('employee')
+_user_deleted = _deleted('user')
+
+
+def connect():
+    User = get_user_model()
+    post_save.connect(_employee_saved, sender=Employee, dispatch_uid='directory:save:Employee')
+    post_delete.connect(_employee_deleted, sender=Employee, dispatch_uid='directory:delete:Employee')
+    post_save.connect(_user_saved, sender=User, dispatch_uid='directory:save:User')
+    pre_delete.connect(_user_deleting, sender=User, dispatch_uid='directory:deleting:User')
+    post_delete.connect(_user_deleted, sender=User, dispatch_uid='directory:delete:User')
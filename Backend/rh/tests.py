@@ -1,3 +1,130 @@
-from django.test import TestCase
+from datetime import date
+from decimal import Decimal
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth.models import update_last_login
+from django.db import transaction
+from django.test import TestCase, override_settings
+
+from users.models import CustomUser, Notification
+
+from . import bulk, directory
+from .models import DirectoryChange, Employee, LeaveRequest
+
+
+class BulkTransitionTests(TestCase):
+    def setUp(self):
+        user = CustomUser.objects.create_user('e1', 'e1@example.com', 'pw')
+        employee = Employee.objects.create(
+            code='E1', nom='Nom', prenom='Prenom', email='e1@example.com', poste='Dev',
+            departement='IT', dateEmbauche=date(2020, 1, 1), salaire=Decimal('1000'), user=user,
+        )
+        self.ids = [
+            LeaveRequest.objects.create(
+                code=f'L{i}', employe=employee, debut=date(2024, 1, 1), fin=date(2024, 1, 2), jours=2, type='Congé payé',
+            ).pk
+            for i in range(3)
+        ]
+
+    def _approve_all_racing(self):
+        """Approves every leave while another manager refuses the first one in between."""
+        update = bulk._update
+
+        def racing(model, ids, source, target):
+            model.objects.filter(pk=self.ids[0]).update(statut='Refusé')
+            return update(model, ids, source, target)
+
+        with mock.patch.object(bulk, '_update', racing):
+            return bulk.bulk_transition([{'type': 'leaves', 'id': pk, 'statut': 'Approuvé'} for pk in self.ids])
+
+    def _assert_first_is_a_conflict(self, results):
+        self.assertEqual(
+            [(r['result'], r['statut']) for r in results],
+            [(bulk.CONFLICT, 'Refusé'), (bulk.APPLIED, 'Approuvé'), (bulk.APPLIED, 'Approuvé')],
+        )
+        self.assertEqual(
+            list(LeaveRequest.objects.order_by('pk').values_list('statut', 'version')),
+            [('Refusé', 0), ('Approuvé', 1), ('Approuvé', 1)],
+        )
+        self.assertEqual(
+            list(Notification.objects.values_list('title', flat=True)),
+            ["Demande de congé approuvée"] * 2,
+        )
+
+    def test_concurrent_change_is_a_conflict(self):
+        self._assert_first_is_a_conflict(self._approve_all_racing())
+
+    def test_concurrent_change_is_a_conflict_without_returning(self):
+        with mock.patch.object(bulk, '_can_return_from_update', return_value=False):
+            self._assert_first_is_a_conflict(self._approve_all_racing())
+
+    def test_invalid_and_missing(self):
+        LeaveRequest.objects.filter(pk=self.ids[0]).update(statut='Refusé')
+        results = bulk.bulk_transition([
+            {'type': 'leaves', 'id': self.ids[0], 'statut': 'Approuvé'},
+            {'type': 'leaves', 'id': 0, 'statut': 'Approuvé'},
+        ])
+        self.assertEqual(
+            [(r['result'], r['statut']) for r in results],
+            [(bulk.INVALID_TRANSITION, 'Refusé'), (bulk.NOT_FOUND, None)],
+        )
+
+
+class DirectorySyncTests(TestCase):
+    def setUp(self):
+        self.employee = Employee.objects.create(
+            code='E1', nom='Nom', prenom='Prenom', email='e1@example.com', poste='Dev',
+            departement='IT', dateEmbauche=date(2020, 1, 1), salaire=Decimal('1000'),
+        )
+        self.token = directory.snapshot()['token']
+
+    def _delta(self):
+        result = directory.sync(directory.parse_token(self.token))
+        self.token = result['token']
+        return [e['id'] for e in result['employees']], result['deleted']['employees']
+
+    def test_rolled_back_change_is_not_sent(self):
+        try:
+            with transaction.atomic():
+                self.employee.poste = 'Lead'
+                self.employee.save()
+                Employee.objects.filter(pk=self.employee.pk).delete()
+                raise RuntimeError
+        except RuntimeError:
+            pass
+        self.assertEqual(self._delta(), ([], []))
+
+        self.employee.refresh_from_db()
+        self.employee.nom = 'Autre'
+        self.employee.save()
+        self.assertEqual(self._delta(), ([self.employee.pk], []))
+        self.assertEqual(self._delta(), ([], []))
+
+    def test_change_committed_late_is_picked_up(self):
+        # An id handed out to a transaction still in flight while a later one commits
+        in_flight = DirectoryChange.objects.latest('id').id + 1
+        other = Employee.objects.create(
+            code='E2', nom='Nom', prenom='Prenom', email='e2@example.com', poste='Dev',
+            departement='IT', dateEmbauche=date(2020, 1, 1), salaire=Decimal('1000'),
+        )
+        DirectoryChange.objects.filter(object_id=other.pk).update(id=in_flight + 1)
+        self.assertEqual(self._delta(), ([other.pk], []))
+
+        DirectoryChange.objects.create(id=in_flight, kind='employee', object_id=self.employee.pk, deleted=True)
+        self.assertEqual(self._delta(), ([], [self.employee.pk]))
+        self.assertEqual(directory.parse_token(self.token)[1], {})
+
+    @override_settings(DIRECTORY_SYNC_GAP_SECONDS=-1)
+    def test_gaps_expire(self):
+        in_flight = DirectoryChange.objects.latest('id').id + 1
+        DirectoryChange.objects.create(id=in_flight + 1, kind='employee', object_id=self.employee.pk)
+        self.assertEqual(self._delta(), ([self.employee.pk], []))
+        self.assertEqual(self._delta(), ([], []))
+        self.assertEqual(directory.parse_token(self.token)[1], {})
+
+    def test_last_login_is_not_a_change(self):
+        user = CustomUser.objects.create_user('u1', 'u1@example.com', 'pw')
+        self.token = directory.snapshot()['token']
+        update_last_login(None, user)
+        result = directory.sync(directory.parse_token(self.token))
+        self.assertEqual(result['users'], [])
@@ -1,19 +1,24 @@
-from rest_framework import viewsets
-from .models import Employee, LeaveRequest, TimeRecord, ExpenseReport, Authorization
+from rest_framework import serializers, viewsets
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from .models import Employee, LeaveRequest, TimeRecord, TimeRecordArchive, ExpenseReport, Authorization
 from .serializers import (
-    EmployeeSerializer, LeaveRequestSerializer, TimeRecordSerializer,
-    ExpenseReportSerializer, AuthorizationSerializer
+    EmployeeSerializer, LeaveRequestSerializer, TimeRecordSerializer, TimeRecordArchiveSerializer,
+    ExpenseReportSerializer, AuthorizationSerializer, BulkTransitionSerializer
 )
+from .bulk import bulk_transition
+from . import directory
 from users.permissions import IsAdmin, IsManager, IsEmployee, IsOwnerOrReadOnly
+from core.mixins import CoalescedListMixin, IncludeArchivedMixin, OptimisticConcurrencyMixin, ScopedListThrottleMixin
 
-class EmployeeViewSet(viewsets.ModelViewSet):
+class EmployeeViewSet(OptimisticConcurrencyMixin, viewsets.ModelViewSet):
     queryset = Employee.objects.all()
     serializer_class = EmployeeSerializer
     # Admin and Manager can manage employees. 
     # Regular employees can maybe view only (or implemented differently)
     permission_classes = [IsManager] 
 
-class LeaveRequestViewSet(viewsets.ModelViewSet):
+class LeaveRequestViewSet(OptimisticConcurrencyMixin, viewsets.ModelViewSet):
     queryset = LeaveRequest.objects.all()
     serializer_class = LeaveRequestSerializer
     # Logic: Owner can create/view own. Manager/Admin can view/edit all.
@@ -29,10 +34,19 @@ class LeaveRequestViewSet(viewsets.ModelViewSet):
              return LeaveRequest.objects.filter(employe=user.employee_profile)
         return LeaveRequest.objects.none()
 
-class TimeRecordViewSet(viewsets.ModelViewSet):
+class TimeRecordViewSet(
+    ScopedListThrottleMixin, CoalescedListMixin, IncludeArchivedMixin, OptimisticConcurrencyMixin, viewsets.ModelViewSet,
+):
     queryset = TimeRecord.objects.all()
     serializer_class = TimeRecordSerializer
+    archive_serializer_class = TimeRecordArchiveSerializer
     permission_classes = [IsEmployee]
+    throttle_scope = 'time-records'
+
+    def get_coalesce_scope(self):
+        # Admins and managers all see the same rows
+        user = self.request.user
+        return 'all' if user.role in ['admin', 'manager'] else user.pk
 
     def get_queryset(self):
         user = self.request.user
@@ -42,7 +56,23 @@ class TimeRecordViewSet(viewsets.ModelViewSet):
              return TimeRecord.objects.filter(employe=user.employee_profile)
         return TimeRecord.objects.none()
 
-class ExpenseReportViewSet(viewsets.ModelViewSet):
+    def perform_create(self, serializer):
+        # `employe` is read-only, records are clocked by the logged-in employee
+        if not hasattr(self.request.user, 'employee_profile'):
+            raise serializers.ValidationError({'employe': "No employee profile for this user."})
+        serializer.save(employe=self.request.user.employee_profile)
+
+    def get_archive_queryset(self):
+        # Same scoping as get_queryset, archived rows are read-only
+        user = self.request.user
+        queryset = TimeRecordArchive.objects.select_related('employe').order_by('date')
+        if user.role in ['admin', 'manager']:
+            return queryset
+        if hasattr(user, 'employee_profile'):
+             return queryset.filter(employe=user.employee_profile)
+        return queryset.none()
+
+class ExpenseReportViewSet(OptimisticConcurrencyMixin, viewsets.ModelViewSet):
     queryset = ExpenseReport.objects.all()
     serializer_class = ExpenseReportSerializer
     permission_classes = [IsEmployee]
@@ -55,7 +85,7 @@ class ExpenseReportViewSet(viewsets.ModelViewSet):
              return ExpenseReport.objects.filter(employe=user.employee_profile)
         return ExpenseReport.objects.none()
 
-class AuthorizationViewSet(viewsets.ModelViewSet):
+class AuthorizationViewSet(OptimisticConcurrencyMixin, viewsets.ModelViewSet):
     queryset = Authorization.objects.all()
     serializer_class = AuthorizationSerializer
     permission_classes = [IsEmployee]
@@ -67,3 +97,37 @@ class AuthorizationViewSet(viewsets.ModelViewSet):
         if hasattr(user, 'employee_profile'):
              return Authorization.objects.filter(employe=user.employee_profile)
         return Authorization.objects.none()
+
+class BulkTransitionView(APIView):
+    """
+    Approve / refuse many leaves, expenses and authorizations in one call.
+    POST {"items": [{"type": "leaves", "id": 12, "statut": "Approuvé"}, ...]}
+    Returns one result per item: applied, not_found, invalid_transition or conflict.
+    """
+    permission_classes = [IsManager]
+
+    def post(self, request):
+        serializer = BulkTransitionSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        results = bulk_transition(serializer.validated_data['items'])
+        applied = sum(1 for result in results if result['result'] == 'applied')
+        return Response({'applied': applied, 'results': results})
+
+
+class DirectorySyncView(APIView):
+    """
+    Employee / user directory for sync clients: a full snapshot without
+    `?since`, then only the changes and deletions since the returned token.
+    Deltas follow the DirectoryChange log, not timestamps; a transaction that
+    commits more than DIRECTORY_SYNC_GAP_SECONDS after writing its change is
+    missed by delta clients (see rh.directory).
+    """
+    permission_classes = [IsManager]
+
+    def get(self, request):
+        since = request.query_params.get('since')
+        try:
+            since = directory.parse_token(since) if since else None
+        except directory.InvalidToken:
+            raise serializers.ValidationError({'since': "Invalid sync token."})
+        return Response(directory.sync(since))
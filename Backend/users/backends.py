@@ -0,0 +1,36 @@
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+from django.contrib.auth.hashers import make_password, verify_password
+
+from . import hashing
+
+UserModel = get_user_model()
+
+
+class PooledModelBackend(ModelBackend):
+    """
+    ModelBackend with the password hashing done in users.hashing's pool.
+    Only the CPU work is offloaded, queries and the rehash save stay on the
+    request thread (and its DB connection).
+    """
+
+    def authenticate(self, request, username=None, password=None, **kwargs):
+        if username is None:
+            username = kwargs.get(UserModel.USERNAME_FIELD)
+        if username is None or password is None:
+            return None
+        try:
+            user = UserModel._default_manager.get_by_natural_key(username)
+        except UserModel.DoesNotExist:
+            # Same cost as a real check, so unknown usernames can't be timed
+            hashing.run(make_password, password)
+            return None
+
+        is_correct, must_update = hashing.run(verify_password, password, user.password)
+        if not is_correct:
+            return None
+        if must_update:
+            # Older hasher or work factor: upgrade to the preferred one
+            user.password = hashing.run(make_password, password)
+            user.save(update_fields=['password'])
+        return user if self.user_can_authenticate(user) else None
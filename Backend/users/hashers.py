@@ -0,0 +1,17 @@
+from django.conf import settings
+from django.contrib.auth.hashers import Argon2PasswordHasher, ScryptPasswordHasher
+
+# Work factors come from settings so they can be tuned per deployment. Hashes
+# made with other parameters are upgraded on the next successful login
+# (must_update compares them).
+
+
+class TunedScryptPasswordHasher(ScryptPasswordHasher):
+    work_factor = getattr(settings, 'SCRYPT_WORK_FACTOR', ScryptPasswordHasher.work_factor)
+
+
+class TunedArgon2PasswordHasher(Argon2PasswordHasher):
+    # Requires argon2-cffi
+    time_cost = getattr(settings, 'ARGON2_TIME_COST', Argon2PasswordHasher.time_cost)
+    memory_cost = getattr(settings, 'ARGON2_MEMORY_COST', Argon2PasswordHasher.memory_cost)
+    parallelism = getattr(settings, 'ARGON2_PARALLELISM', Argon2PasswordHasher.parallelism)
@@ -0,0 +1,31 @@
+"""
+Bounded pool for password hashing.
+
+hashlib's scrypt/pbkdf2 and argon2-cffi release the GIL, so with threaded
+gunicorn workers hashes run in parallel. The pool caps how many run at once
+(PASSWORD_HASH_WORKERS, default: CPU count) so a login burst queues instead
+of oversubscribing the CPUs, while the other requests keep being served.
+"""
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+
+_executor = None
+_lock = threading.Lock()
+
+
+def _get_executor():
+    global _executor
+    if _executor is None:
+        with _lock:
+            if _executor is None:
+                workers = getattr(settings, 'PASSWORD_HASH_WORKERS', None) or os.cpu_count() or 1
+                _executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='password-hash')
+    return _executor
+
+
+def run(func, *args, **kwargs):
+    """Runs a CPU-bound, DB-free call in the pool and waits for its result."""
+    return _get_executor().submit(func, *args, **kwargs).result()
@@ -0,0 +1,85 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import get_hashers
+from django.core.management.base import BaseCommand
+from django.test import override_settings
+from django.utils.module_loading import import_string
+from rest_framework.test import APIRequestFactory
+from rest_framework_simplejwt.views import TokenObtainPairView
+
+from core.bench import rolled_back
+from users.views import LoginView
+
+STOCK = {
+    'AUTHENTICATION_BACKENDS': ['django.contrib.auth.backends.ModelBackend'],
+    'PASSWORD_HASHERS': ['django.contrib.auth.hashers.PBKDF2PasswordHasher'],
+}
+HASHERS = [
+    'django.contrib.auth.hashers.PBKDF2PasswordHasher',
+    'users.hashers.TunedScryptPasswordHasher',
+    'users.hashers.TunedArgon2PasswordHasher',
+]
+
+
+class Command(BaseCommand):
+    help = "Benchmarks password verification and /api/token/ logins per second, stock vs tuned."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--logins', type=int, default=20)
+        parser.add_argument('--threads', type=int, default=4)
+
+    def handle(self, *args, **options):
+        logins, threads = options['logins'], options['threads']
+
+        self.stdout.write(f"{'hasher':<28}{'1 thread':>12}{f'{threads} threads':>14}  (verifications/s)")
+        for path in HASHERS:
+            hasher = import_string(path)()
+            try:
+                encoded = hasher.encode('Secret-pw-123', hasher.salt())
+            except ValueError as exc:  # library not installed
+                self.stdout.write(f"{hasher.algorithm:<28}skipped: {exc}")
+                continue
+            rates = [self._rate(lambda: hasher.verify('Secret-pw-123', encoded), logins * n, n) for n in (1, threads)]
+            self.stdout.write(f"{path.rsplit('.', 1)[1]:<28}{rates[0]:>12.1f}{rates[1]:>14.1f}")
+
+        with rolled_back():
+            self._logins(logins)
+
+    def _rate(self, func, count, threads):
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            for future in [pool.submit(func) for _ in range(count)]:
+                future.result()
+        return count / (time.perf_counter() - start)
+
+    def _sequential_rate(self, func, count):
+        # Logins stay on this thread: the benchmark data only exists in its transaction
+        start = time.perf_counter()
+        for _ in range(count):
+            func()
+        return count / (time.perf_counter() - start)
+
+    def _logins(self, count):
+        factory = APIRequestFactory()
+        payload = {'username': 'bench.login', 'password': 'Secret-pw-123'}
+
+        def login(view):
+            response = view(factory.post('/api/token/', payload, format='json'))
+            assert response.status_code == 200, response.data
+
+        with override_settings(**STOCK):
+            get_hashers.cache_clear()
+            get_user_model().objects.create_user(**payload)
+            view = TokenObtainPairView.as_view()
+            before = self._sequential_rate(lambda: login(view), count)
+        get_hashers.cache_clear()
+
+        view = LoginView.as_view()
+        login(view)  # first login upgrades the PBKDF2 hash
+        after = self._sequential_rate(lambda: login(view), count)
+
+        self.stdout.write(f"/api/token/ stock (PBKDF2, ModelBackend): {before:.1f} logins/s")
+        self.stdout.write(f"/api/token/ tuned ({settings.PASSWORD_HASHERS[0].rsplit('.', 1)[1]}, pooled): {after:.1f} logins/s")
@@ -0,0 +1,39 @@
+# Generated by Django 5.2.9 on 2026-10-19 12:08
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0002_notification'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='NotificationArchive',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('title', models.CharField(max_length=255)),
+                ('message', models.TextField()),
+                ('read', models.BooleanField(default=False)),
+                ('created_at', models.DateTimeField()),
+                ('archived_at', models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(fields=['created_at'], name='users_notif_created_3ee999_idx'),
+        ),
+        migrations.AddField(
+            model_name='notificationarchive',
+            name='user',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='archived_notifications', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddIndex(
+            model_name='notificationarchive',
+            index=models.Index(fields=['user', '-created_at'], name='users_notif_user_id_e4e7dc_idx'),
+        ),
+    ]
@@ -22,5 +22,24 @@ class Notification(models.Model):
     read = models.BooleanField(default=False)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [models.Index(fields=['created_at'])]  # archive_records scans by date
+
+    def __str__(self):
+        return f"{self.title} - {self.user.username}"
+
+class NotificationArchive(models.Model):
+    # Rows moved out of Notification by `manage.py archive_records`, same ids
+    id = models.BigIntegerField(primary_key=True)
+    user = models.ForeignKey(CustomUser, on_delete=models.CASCADE, related_name='archived_notifications')
+    title = models.CharField(max_length=255)
+    message = models.TextField()
+    read = models.BooleanField(default=False)
+    created_at = models.DateTimeField()
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [models.Index(fields=['user', '-created_at'])]
+
     def __str__(self):
         return f"{self.title} - {self.user.username}"
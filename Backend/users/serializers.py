@@ -1,5 +1,6 @@
 from rest_framework import serializers
-from .models import CustomUser, Notification
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
+from .models import CustomUser, Notification, NotificationArchive
 
 class UserSerializer(serializers.ModelSerializer):
     id = serializers.CharField(source='employee_id', read_only=True)
@@ -10,7 +11,20 @@ class UserSerializer(serializers.ModelSerializer):
         model = CustomUser
         fields = ['id', 'firstName', 'lastName', 'email', 'role', 'departement']
 
+class TokenObtainPairWithProfileSerializer(TokenObtainPairSerializer):
+    """Adds the user profile to the token response, saving the client a /api/users/ call."""
+
+    def validate(self, attrs):
+        data = super().validate(attrs)
+        data['user'] = UserSerializer(self.user).data
+        return data
+
 class NotificationSerializer(serializers.ModelSerializer):
     class Meta:
         model = Notification
         fields = ['id', 'user', 'title', 'message', 'read', 'created_at']
+
+class NotificationArchiveSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = NotificationArchive
+        fields = ['id', 'user', 'title', 'message', 'read', 'created_at']
@@ -1,17 +1,31 @@
 from rest_framework import viewsets, permissions
-from .models import CustomUser, Notification
-from .serializers import UserSerializer, NotificationSerializer
+from rest_framework_simplejwt.views import TokenObtainPairView
+from .models import CustomUser, Notification, NotificationArchive
+from .serializers import (
+    UserSerializer, NotificationSerializer, NotificationArchiveSerializer, TokenObtainPairWithProfileSerializer
+)
 from .permissions import IsAdmin, IsManager, IsEmployee
+from core.mixins import IncludeArchivedMixin
 
 class UserViewSet(viewsets.ModelViewSet):
     queryset = CustomUser.objects.all()
     serializer_class = UserSerializer
     permission_classes = [IsAdmin] # Only admins can manage users directly
 
-class NotificationViewSet(viewsets.ModelViewSet):
+class LoginView(TokenObtainPairView):
+    serializer_class = TokenObtainPairWithProfileSerializer
+    # Anonymous, so UserRateThrottle would key on the client IP: a whole office
+    # behind one NAT logging in at shift start would be throttled
+    throttle_classes = []
+
+class NotificationViewSet(IncludeArchivedMixin, viewsets.ModelViewSet):
     serializer_class = NotificationSerializer
+    archive_serializer_class = NotificationArchiveSerializer
     permission_classes = [permissions.IsAuthenticated]
 
     def get_queryset(self):
         # Users see only their own notifications
         return Notification.objects.filter(user=self.request.user).order_by('-created_at')
+
+    def get_archive_queryset(self):
+        return NotificationArchive.objects.filter(user=self.request.user).order_by('-created_at')
@@ -32,11 +32,11 @@ export function AuthProvider({ children }: { children: React.ReactNode }) {
       const result = await loginMutation.mutateAsync({ email, password, role });
       
       const newUser: AuthUser = {
-        id: result.user.id.toString(),
+        id: (result.user.id ?? "").toString(),
         email: result.user.email,
         role: result.user.role || role,
-        firstName: result.user.first_name,
-        lastName: result.user.last_name,
+        firstName: result.user.firstName,
+        lastName: result.user.lastName,
       };
       
       setUser(newUser);
@@ -111,10 +111,10 @@ export function useLogin(): UseMutationResult<AuthResponse, Error, LoginCredenti
 
       const tokens = await response.json();
 
-      // IMPORTANT: In a real app, decode the JWT here or call /users/me/ to get real user data.
-      // Returning a placeholder based on input for now as per your previous code structure.
+      // The token response embeds the user profile, no extra /users/ call needed.
+      // The placeholder is only a fallback for older backends.
       return {
-        user: { 
+        user: tokens.user ?? { 
             id: "1", // Placeholder ID
             email: payload.username || "", 
             firstName: "Utilisateur", 